@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    if sys.platform == "win32":
+        from blinkstick.backends.win32 import Win32Backend as USBBackend
+    else:
+        from blinkstick.backends.unix_like import UnixLikeBackend as USBBackend
+
+
+@lru_cache(maxsize=None)
+def get_usb_backend() -> type[USBBackend]:
+    """
+    Get the USB backend class for this platform.
+
+    The backend module, and the pywinusb or pyusb library it loads, is only
+    imported on the first call.
+    """
+    if sys.platform == "win32":
+        from blinkstick.backends.win32 import Win32Backend
+
+        return Win32Backend
+
+    from blinkstick.backends.unix_like import UnixLikeBackend
+
+    return UnixLikeBackend
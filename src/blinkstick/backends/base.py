@@ -39,7 +39,7 @@ class BaseBackend(ABC, Generic[T]):
         bRequest: int,
         wValue: int,
         wIndex: int,
-        data_or_wLength: bytes | int,
+        data_or_wLength: bytes | bytearray | int,
     ):
         raise NotImplementedError
 
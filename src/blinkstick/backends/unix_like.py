@@ -89,7 +89,7 @@ class UnixLikeBackend(BaseBackend[usb.core.Device]):
         bRequest: int,
         wValue: int,
         wIndex: int,
-        data_or_wLength: bytes | int,
+        data_or_wLength: bytes | bytearray | int,
     ):
         try:
             return self.blinkstick_device.raw_device.ctrl_transfer(
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import sys
+from bisect import bisect_left
+from typing import TYPE_CHECKING
 
 from blinkstick.animation.animator import Animator
 from blinkstick.animation.blink import BlinkAnimation
 from blinkstick.animation.morph import MorphAnimation
 from blinkstick.animation.pulse import PulseAnimation
+from blinkstick.backends import get_usb_backend
 from blinkstick.colors import (
     RGBColor,
     NamedColor,
@@ -15,15 +17,24 @@ from blinkstick.enums import BlinkStickVariant, Mode, Channel
 from blinkstick.exceptions import NotConnected
 from blinkstick.utilities import string_to_info_block_data, convert_to_rgb_color
 
-if sys.platform == "win32":
-    from blinkstick.backends.win32 import Win32Backend as USBBackend
-else:
-    from blinkstick.backends.unix_like import UnixLikeBackend as USBBackend
+if TYPE_CHECKING:
+    from blinkstick.backends import USBBackend
 
 """
 Main module to control BlinkStick and BlinkStick Pro devices.
 """
 
+# control strings for the mode feature report, built once for the valid modes: 0, the
+# documented default, which has no Mode member, and each Mode
+_MODE_CONTROL_STRINGS = {
+    mode: bytes((4, mode)) for mode in (0, *(mode.value for mode in Mode))
+}
+
+# (report id, max leds) for LED data frames, picked by the largest frame size in
+# bytes each smaller report can hold; anything bigger uses the 64 LED report
+_LED_DATA_REPORT_LIMITS = (8 * 3, 16 * 3, 32 * 3)
+_LED_DATA_REPORTS = ((6, 8), (7, 16), (8, 32), (9, 64))
+
 
 class BlinkStick:
     """
@@ -57,7 +68,7 @@ class BlinkStick:
         self.animator = Animator(self)
 
         if device:
-            self.backend = USBBackend(device)
+            self.backend = get_usb_backend()(device)
 
     def __getattribute__(self, name):
         """Default all callables to require a backend unless they have the no_backend_required attribute"""
@@ -171,19 +182,27 @@ class BlinkStick:
             - CSS color name as defined here: U{http://www.w3.org/TR/css3-color/}
             - Hexadecimal color value in 3 or 6 digits, with or without a '#' prefix e.g. '#FF3366', 'FF3366', '#F3F', 'F3F'
         """
-        target_color = convert_to_rgb_color(color)
+        # animations pass RGBColor instances on every frame, so skip the conversion call for them
+        if color.__class__ is RGBColor:
+            target_color = color
+        else:
+            target_color = convert_to_rgb_color(color)
 
         if self._inverse:
             # Inverse mode is enabled, so invert the color using the bitwise NOT operator (fancy!)
             target_color = ~target_color
 
-        red, green, blue = target_color.remap_to_new_range(max_value=self.max_rgb_value)
+        # remapping to the full 0..255 range is the identity, so skip it for the default brightness
+        if self._max_rgb_value != 255:
+            target_color = target_color.remap_to_new_range(
+                max_value=self._max_rgb_value
+            )
 
         if index == 0 and channel == 0:
-            control_string = bytes(bytearray([0, red, green, blue]))
+            control_string = b"\x00" + target_color.as_bytes
             report_id = 0x0001
         else:
-            control_string = bytes(bytearray([5, channel, index, red, green, blue]))
+            control_string = bytes((5, channel, index)) + target_color.as_bytes
             report_id = 0x0005
 
         if self._error_reporting:
@@ -232,45 +251,31 @@ class BlinkStick:
         return self._get_color(index=index)
 
     def _determine_report_id(self, led_count: int) -> tuple[int, int]:
-        report_id = 9
-        max_leds = 64
-
-        if led_count <= 8 * 3:
-            max_leds = 8
-            report_id = 6
-        elif led_count <= 16 * 3:
-            max_leds = 16
-            report_id = 7
-        elif led_count <= 32 * 3:
-            max_leds = 32
-            report_id = 8
-        elif led_count <= 64 * 3:
-            max_leds = 64
-            report_id = 9
-
-        return report_id, max_leds
-
-    def set_led_data(self, channel: Channel, data: list[int]) -> None:
+        return _LED_DATA_REPORTS[bisect_left(_LED_DATA_REPORT_LIMITS, led_count)]
+
+    def set_led_data(
+        self, channel: Channel, data: bytes | bytearray | memoryview | list[int]
+    ) -> None:
         """
         Send LED data frame.
 
         @type  channel: int
         @param channel: the channel which to send data to (R=0, G=1, B=2)
-        @type  data: int[0..64*3]
+        @type  data: bytes-like object or int[0..64*3]
         @param data: The LED data frame in GRB color_mode
         """
 
         report_id, max_leds = self._determine_report_id(len(data))
 
-        report = [0, channel]
+        report_length = max_leds * 3
+        data = data[:report_length]
 
-        for i in range(0, max_leds * 3):
-            if len(data) > i:
-                report.append(data[i])
-            else:
-                report.append(0)
+        # copy the frame straight into a zero padded report buffer
+        report = bytearray(report_length + 2)
+        report[1] = channel
+        report[2 : 2 + len(data)] = data
 
-        self.backend.control_transfer(0x20, 0x9, report_id, 0, bytes(bytearray(report)))
+        self.backend.control_transfer(0x20, 0x9, report_id, 0, report)
 
     def get_led_data(self, count: int) -> list[int]:
         """
@@ -330,11 +335,13 @@ class BlinkStick:
         @type  mode: int
         @param mode: Device mode to set
         """
-        # If mode is an enum, get the value
-        # this will allow the user to pass in the enum directly, and also gate the value to the enum values
-        if not isinstance(mode, int):
-            mode = Mode(mode).value
-        control_string = bytes(bytearray([4, mode]))
+        # Mode is an IntEnum, so enum members and plain ints share the lookup; strings,
+        # floats and out of range values are rejected rather than coerced
+        if not isinstance(mode, int) or mode not in _MODE_CONTROL_STRINGS:
+            raise ValueError(
+                f"Invalid mode: {mode!r}. Must be one of {list(_MODE_CONTROL_STRINGS)}."
+            )
+        control_string = _MODE_CONTROL_STRINGS[mode]
 
         self.backend.control_transfer(0x20, 0x9, 0x0004, 0, control_string)
 
@@ -362,7 +369,7 @@ class BlinkStick:
         @type  count: int
         @param count: number of LEDs to control
         """
-        control_string = bytes(bytearray([0x81, count]))
+        control_string = bytes((0x81, count))
 
         self.backend.control_transfer(0x20, 0x9, 0x81, 0, control_string)
 
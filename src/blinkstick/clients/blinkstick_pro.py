@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import logging
 import time
+from typing import Sequence
 
 from blinkstick.clients import BlinkStick
-from blinkstick.colors import remap_color
+from blinkstick.colors import _remap_table
 from blinkstick.enums import Channel
 
+logger = logging.getLogger(__name__)
+
+# 3x5 bitmaps of the digits 0..9 rendered by BlinkStickProMatrix.number, one
+# row of three pixels per group of bits, top row in the most significant bits
+_DIGITS = (
+    0b111_101_101_101_111,
+    0b010_110_010_010_111,
+    0b111_001_111_100_111,
+    0b111_001_111_001_111,
+    0b101_101_111_001_001,
+    0b111_100_111_001_111,
+    0b111_100_111_101_111,
+    0b111_001_010_010_010,
+    0b111_101_111_101_111,
+    0b111_101_111_001_111,
+)
+
 
 class BlinkStickPro:
     """
@@ -20,15 +39,32 @@ class BlinkStickPro:
     U{https://github.com/arvydas/blinkstick-python/wiki#code-examples-for-blinkstick-pro}
     """
 
+    __slots__ = (
+        "r_led_count",
+        "g_led_count",
+        "b_led_count",
+        "fps_count",
+        "data_transmission_delay",
+        "_next_send_deadline",
+        "_max_rgb_value",
+        "_remap_lut",
+        "data",
+        "bstick",
+    )
+
     r_led_count: int
     g_led_count: int
     b_led_count: int
     fps_count: int
     data_transmission_delay: float
-    max_rgb_value: int
-    data: list[list[list[int]]]
+    _next_send_deadline: float
+    _max_rgb_value: int
+    _remap_lut: bytes
+    data: list[bytearray]
     bstick: BlinkStick | None
 
+    _CHANNELS = (Channel.RED, Channel.GREEN, Channel.BLUE)
+
     def __init__(
         self,
         r_led_count: int = 0,
@@ -59,22 +95,18 @@ class BlinkStickPro:
         self.fps_count = -1
 
         self.data_transmission_delay = delay
+        self._next_send_deadline = 0.0
 
         self.max_rgb_value = max_rgb_value
 
         # initialise data store for each channel
-        # pre-populated with zeroes
+        # pre-populated with zeroes, three bytes per LED in GRB order
 
-        self.data = [[], [], []]
-
-        for i in range(0, r_led_count):
-            self.data[0].append([0, 0, 0])
-
-        for i in range(0, g_led_count):
-            self.data[1].append([0, 0, 0])
-
-        for i in range(0, b_led_count):
-            self.data[2].append([0, 0, 0])
+        self.data = [
+            bytearray(r_led_count * 3),
+            bytearray(g_led_count * 3),
+            bytearray(b_led_count * 3),
+        ]
 
         self.bstick = None
 
@@ -104,10 +136,66 @@ class BlinkStickPro:
         @param remap_values: remap the values to maximum set in L{set_max_rgb_value}
         """
 
-        if remap_values:
-            r, g, b = [remap_color(val, self.max_rgb_value) for val in [r, g, b]]
+        # the lookup table is the identity for the default max_rgb_value of 255
+        if remap_values and self._max_rgb_value != 255:
+            lut = self._remap_lut
+            r, g, b = lut[r], lut[g], lut[b]
+
+        self._set_color_raw(channel, index, r, g, b)
+
+    def _set_color_raw(self, channel: int, index: int, r: int, g: int, b: int) -> None:
+        data = self.data[channel]
+        offset = index * 3
+        data[offset] = g
+        data[offset + 1] = r
+        data[offset + 2] = b
+
+    def set_pixels_bulk(
+        self,
+        channel: int,
+        colors: Sequence[tuple[int, int, int]],
+        remap_values: bool = True,
+    ) -> None:
+        """
+        Set the color of consecutive pixels on a channel in one call, starting
+        with the first LED. This avoids the per-pixel overhead of calling
+        L{set_color} in a loop when a whole frame is recomputed.
+
+        @type channel: int
+        @param channel: R, G or B channel
+        @type colors: [(int, int, int)]
+        @param colors: sequence of R, G and B color bytes, one per LED
+        @type remap_values: bool
+        @param remap_values: remap the values to maximum set in L{set_max_rgb_value}
+        """
+
+        data = self.data[channel]
+        packet_data = bytes([value for r, g, b in colors for value in (g, r, b)])
+
+        if len(packet_data) > len(data):
+            raise IndexError("More colors than LEDs on channel {0}".format(channel))
 
-        self.data[channel][index] = [g, r, b]
+        if remap_values and self._max_rgb_value != 255:
+            packet_data = packet_data.translate(self._remap_lut)
+
+        data[: len(packet_data)] = packet_data
+
+    def set_frame(
+        self,
+        frame: Sequence[Sequence[tuple[int, int, int]]],
+        remap_values: bool = True,
+    ) -> None:
+        """
+        Set the color of the pixels on all channels in one call.
+
+        @type frame: [[(int, int, int)]]
+        @param frame: one sequence of R, G and B color bytes per channel, in R, G, B channel order
+        @type remap_values: bool
+        @param remap_values: remap the values to maximum set in L{set_max_rgb_value}
+        """
+
+        for channel, colors in enumerate(frame):
+            self.set_pixels_bulk(channel, colors, remap_values)
 
     def get_color(self, channel: Channel, index: int) -> tuple[int, int, int]:
         """
@@ -122,21 +210,40 @@ class BlinkStickPro:
         @return: 3-tuple for R, G and B values
         """
 
-        val = self.data[channel][index]
-        return val[1], val[0], val[2]
+        data = self.data[channel]
+        offset = index * 3
+        return data[offset + 1], data[offset], data[offset + 2]
 
-    def clear(self) -> None:
+    @property
+    def max_rgb_value(self) -> int:
         """
-        Set all pixels to black in the frame buffer.
+        Get RGB color limit. L{set_color} will automatically remap the values
+        to the maximum set.
+
+        @rtype: int
+        @return: 0..255 maximum value for each R, G and B color
         """
-        for x in range(0, self.r_led_count):
-            self.set_color(0, x, 0, 0, 0)
+        return self._max_rgb_value
 
-        for x in range(0, self.g_led_count):
-            self.set_color(1, x, 0, 0, 0)
+    @max_rgb_value.setter
+    def max_rgb_value(self, value: int) -> None:
+        """
+        Set RGB color limit. The remap lookup table used by L{set_color} is
+        fetched here, so that remapping a color is a table lookup per byte.
 
-        for x in range(0, self.b_led_count):
-            self.set_color(2, x, 0, 0, 0)
+        @type  value: int
+        @param value: 0..255 maximum value for each R, G and B color
+        """
+        value = max(0, min(255, int(value)))
+        self._max_rgb_value = value
+        self._remap_lut = _remap_table(value)
+
+    def clear(self) -> None:
+        """
+        Set all pixels to black in the frame buffer.
+        """
+        for data in self.data:
+            data[:] = bytes(len(data))
 
     def off(self) -> None:
         """
@@ -164,6 +271,32 @@ class BlinkStickPro:
 
         return self.bstick is not None
 
+    def get_packet_data(self, channel: int) -> bytes:
+        """
+        Get the data stored in the internal buffer for the channel, as sent
+        to the backend.
+
+        @type channel: int
+        @param channel: R, G or B channel
+        @rtype: bytes
+        @return: the LED data of the channel in GRB color_mode
+        """
+
+        return bytes(self.data[channel])
+
+    def get_packet_memoryview(self, channel: int) -> memoryview:
+        """
+        Get a read-only view of the data for the channel, as sent to the
+        backend. L{BlinkStick.set_led_data} accepts the view directly.
+
+        @type channel: int
+        @param channel: R, G or B channel
+        @rtype: memoryview
+        @return: the LED data of the channel in GRB color_mode
+        """
+
+        return memoryview(self.data[channel]).toreadonly()
+
     def send_data(self, channel: Channel) -> None:
         """
         Send data stored in the internal buffer to the channel.
@@ -173,29 +306,59 @@ class BlinkStickPro:
             - 1 - G pin on BlinkStick Pro board
             - 2 - B pin on BlinkStick Pro board
         """
-        if self.bstick is None:
-            return
+        self._wait_for_next_send()
+
+        if self._send_data(channel):
+            self._schedule_next_send()
+
+    def _wait_for_next_send(self) -> None:
+        """
+        Sleep for whatever is left of the transmission delay since the last
+        send. Time already spent since then, e.g. preparing the next frame,
+        counts towards the delay.
+        """
+        remaining = self._next_send_deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _schedule_next_send(self) -> None:
+        self._next_send_deadline = time.monotonic() + self.data_transmission_delay
 
-        packet_data = [item for sublist in self.data[channel] for item in sublist]
+    def _send_data(self, channel: Channel) -> bool:
+        """
+        Send data stored in the internal buffer to the channel, without waiting
+        for the transmission delay afterwards.
+
+        @rtype: bool
+        @return: True if the data was sent, otherwise False
+        """
+        if self.bstick is None:
+            return False
 
         try:
-            self.bstick.set_led_data(channel, packet_data)
-            time.sleep(self.data_transmission_delay)
-        except Exception as e:
-            print("Exception: {0}".format(e))
+            self.bstick.set_led_data(channel, self.get_packet_memoryview(channel))
+        except Exception:
+            logger.exception("Could not send data to channel %s", channel)
+            return False
+
+        return True
 
     def send_data_all(self) -> None:
         """
-        Send data to all channels
+        Send data to all channels. The channels are sent back-to-back and the
+        transmission delay is waited once for the whole frame.
         """
-        if self.r_led_count > 0:
-            self.send_data(0)
+        self._wait_for_next_send()
+
+        led_counts = (self.r_led_count, self.g_led_count, self.b_led_count)
+        sent = False
 
-        if self.g_led_count > 0:
-            self.send_data(1)
+        for channel, led_count in zip(self._CHANNELS, led_counts):
+            if led_count > 0:
+                sent = self._send_data(channel) or sent
 
-        if self.b_led_count > 0:
-            self.send_data(2)
+        if sent:
+            self._schedule_next_send()
 
 
 class BlinkStickProMatrix(BlinkStickPro):
@@ -229,6 +392,19 @@ class BlinkStickProMatrix(BlinkStickPro):
 
     """
 
+    __slots__ = (
+        "r_columns",
+        "r_rows",
+        "g_columns",
+        "g_rows",
+        "b_columns",
+        "b_rows",
+        "rows",
+        "cols",
+        "matrix_data",
+        "_channel_bounds",
+    )
+
     r_columns: int
     r_rows: int
     g_columns: int
@@ -237,7 +413,8 @@ class BlinkStickProMatrix(BlinkStickPro):
     b_rows: int
     rows: int
     cols: int
-    matrix_data: list[list[int]]
+    matrix_data: bytearray
+    _channel_bounds: tuple[tuple[int, int], ...]
 
     def __init__(
         self,
@@ -286,11 +463,21 @@ class BlinkStickProMatrix(BlinkStickPro):
         self.rows = max(r_rows, g_rows, b_rows)
         self.cols = r_columns + g_columns + b_columns
 
-        # initialise data store for matrix pre-populated with zeroes
-        self.matrix_data = []
+        # initialise data store for matrix pre-populated with zeroes,
+        # three bytes per pixel in GRB order
+        self.matrix_data = bytearray(self.rows * self.cols * 3)
 
-        for i in range(0, self.rows * self.cols):
-            self.matrix_data.append([0, 0, 0])
+        # first and last column of each channel, with a channel buffer
+        # sized to hold those columns for every row of the matrix
+        self._channel_bounds = (
+            (0, r_columns),
+            (r_columns, r_columns + g_columns),
+            (r_columns + g_columns, self.cols),
+        )
+        self.data = [
+            bytearray(self.rows * (end_col - start_col) * 3)
+            for start_col, end_col in self._channel_bounds
+        ]
 
     def set_color(
         self, x: int, y: int, r: int, g: int, b: int, remap_values: bool = True
@@ -312,13 +499,22 @@ class BlinkStickProMatrix(BlinkStickPro):
         @param remap_values: Automatically remap values based on the {max_rgb_value} supplied in the constructor
         """
 
-        if remap_values:
-            r, g, b = [remap_color(val, self.max_rgb_value) for val in [r, g, b]]
+        # the lookup table is the identity for the default max_rgb_value of 255
+        if remap_values and self._max_rgb_value != 255:
+            lut = self._remap_lut
+            r, g, b = lut[r], lut[g], lut[b]
+
+        self._set_color_raw(x, y, r, g, b)
 
-        self.matrix_data[self._coord_to_index(x, y)] = [g, r, b]
+    def _set_color_raw(self, x: int, y: int, r: int, g: int, b: int) -> None:
+        matrix_data = self.matrix_data
+        offset = self._coord_to_index(x, y)
+        matrix_data[offset] = g
+        matrix_data[offset + 1] = r
+        matrix_data[offset + 2] = b
 
     def _coord_to_index(self, x: int, y: int) -> int:
-        return y * self.cols + x
+        return (y * self.cols + x) * 3
 
     def get_color(self, x: int, y: int) -> tuple[int, int, int]:
         """
@@ -333,8 +529,9 @@ class BlinkStickProMatrix(BlinkStickPro):
         @return: 3-tuple for R, G and B values
         """
 
-        val = self.matrix_data[self._coord_to_index(x, y)]
-        return val[1], val[0], val[2]
+        matrix_data = self.matrix_data
+        offset = self._coord_to_index(x, y)
+        return matrix_data[offset + 1], matrix_data[offset], matrix_data[offset + 2]
 
     def shift_left(self, remove: bool = False) -> None:
         """
@@ -343,24 +540,19 @@ class BlinkStickProMatrix(BlinkStickPro):
         @type remove: bool
         @param remove: whether to remove the pixels on the last column or move the to the first column
         """
-        if not remove:
-            temp = []
-            for y in range(0, self.rows):
-                temp.append(self.get_color(0, y))
-
-        for y in range(0, self.rows):
-            for x in range(0, self.cols - 1):
-                r, g, b = self.get_color(x + 1, y)
-
-                self.set_color(x, y, r, g, b, False)
+        matrix_data = self.matrix_data
+        row_length = self.cols * 3
+        if not matrix_data:
+            return
 
-        if remove:
-            for y in range(0, self.rows):
-                self.set_color(self.cols - 1, y, 0, 0, 0, False)
-        else:
-            for y in range(0, self.rows):
-                col = temp[y]
-                self.set_color(self.cols - 1, y, col[0], col[1], col[2], False)
+        for row_start in range(0, len(matrix_data), row_length):
+            row_end = row_start + row_length
+            if remove:
+                wrapped = bytearray(3)
+            else:
+                wrapped = matrix_data[row_start : row_start + 3]
+            matrix_data[row_start : row_end - 3] = matrix_data[row_start + 3 : row_end]
+            matrix_data[row_end - 3 : row_end] = wrapped
 
     def shift_right(self, remove: bool = False) -> None:
         """
@@ -369,25 +561,19 @@ class BlinkStickProMatrix(BlinkStickPro):
         @type remove: bool
         @param remove: whether to remove the pixels on the last column or move the to the first column
         """
+        matrix_data = self.matrix_data
+        row_length = self.cols * 3
+        if not matrix_data:
+            return
 
-        if not remove:
-            temp = []
-            for y in range(0, self.rows):
-                temp.append(self.get_color(self.cols - 1, y))
-
-        for y in range(0, self.rows):
-            for x in reversed(range(1, self.cols)):
-                r, g, b = self.get_color(x - 1, y)
-
-                self.set_color(x, y, r, g, b, False)
-
-        if remove:
-            for y in range(0, self.rows):
-                self.set_color(0, y, 0, 0, 0, False)
-        else:
-            for y in range(0, self.rows):
-                col = temp[y]
-                self.set_color(0, y, col[0], col[1], col[2], False)
+        for row_start in range(0, len(matrix_data), row_length):
+            row_end = row_start + row_length
+            if remove:
+                wrapped = bytearray(3)
+            else:
+                wrapped = matrix_data[row_end - 3 : row_end]
+            matrix_data[row_start + 3 : row_end] = matrix_data[row_start : row_end - 3]
+            matrix_data[row_start : row_start + 3] = wrapped
 
     def shift_down(self, remove: bool = False) -> None:
         """
@@ -396,25 +582,17 @@ class BlinkStickProMatrix(BlinkStickPro):
         @type remove: bool
         @param remove: whether to remove the pixels on the last column or move the to the first column
         """
-
-        if not remove:
-            temp = []
-            for x in range(0, self.cols):
-                temp.append(self.get_color(x, self.rows - 1))
-
-        for y in reversed(range(1, self.rows)):
-            for x in range(0, self.cols):
-                r, g, b = self.get_color(x, y - 1)
-
-                self.set_color(x, y, r, g, b, False)
+        matrix_data = self.matrix_data
+        row_length = self.cols * 3
+        if not matrix_data:
+            return
 
         if remove:
-            for x in range(0, self.cols):
-                self.set_color(x, 0, 0, 0, 0, False)
+            wrapped = bytearray(row_length)
         else:
-            for x in range(0, self.cols):
-                col = temp[x]
-                self.set_color(x, 0, col[0], col[1], col[2], False)
+            wrapped = matrix_data[-row_length:]
+        matrix_data[row_length:] = matrix_data[:-row_length]
+        matrix_data[:row_length] = wrapped
 
     def shift_up(self, remove: bool = False):
         """
@@ -423,25 +601,17 @@ class BlinkStickProMatrix(BlinkStickPro):
         @type remove: bool
         @param remove: whether to remove the pixels on the last column or move the to the first column
         """
-
-        if not remove:
-            temp = []
-            for x in range(0, self.cols):
-                temp.append(self.get_color(x, 0))
-
-        for x in range(0, self.cols):
-            for y in range(0, self.rows - 1):
-                r, g, b = self.get_color(x, y + 1)
-
-                self.set_color(x, y, r, g, b, False)
+        matrix_data = self.matrix_data
+        row_length = self.cols * 3
+        if not matrix_data:
+            return
 
         if remove:
-            for x in range(0, self.cols):
-                self.set_color(x, self.rows - 1, 0, 0, 0, False)
+            wrapped = bytearray(row_length)
         else:
-            for x in range(0, self.cols):
-                col = temp[x]
-                self.set_color(x, self.rows - 1, col[0], col[1], col[2], False)
+            wrapped = matrix_data[:row_length]
+        matrix_data[:-row_length] = matrix_data[row_length:]
+        matrix_data[-row_length:] = wrapped
 
     def number(self, x: int, y: int, n: int, r: int, g: int, b: int) -> None:
         """
@@ -460,60 +630,18 @@ class BlinkStickProMatrix(BlinkStickPro):
         @type b: int
         @param b: blue color byte
         """
-        if n == 0:
-            self.rectangle(x, y, x + 2, y + 4, r, g, b)
-        elif n == 1:
-            self.line(x + 1, y, x + 1, y + 4, r, g, b)
-            self.line(x, y + 4, x + 2, y + 4, r, g, b)
-            self.set_color(x, y + 1, r, g, b)
-        elif n == 2:
-            self.line(x, y, x + 2, y, r, g, b)
-            self.line(x, y + 2, x + 2, y + 2, r, g, b)
-            self.line(x, y + 4, x + 2, y + 4, r, g, b)
-            self.set_color(x + 2, y + 1, r, g, b)
-            self.set_color(x, y + 3, r, g, b)
-        elif n == 3:
-            self.line(x, y, x + 2, y, r, g, b)
-            self.line(x, y + 2, x + 2, y + 2, r, g, b)
-            self.line(x, y + 4, x + 2, y + 4, r, g, b)
-            self.set_color(x + 2, y + 1, r, g, b)
-            self.set_color(x + 2, y + 3, r, g, b)
-        elif n == 4:
-            self.line(x, y, x, y + 2, r, g, b)
-            self.line(x + 2, y, x + 2, y + 4, r, g, b)
-            self.set_color(x + 1, y + 2, r, g, b)
-        elif n == 5:
-            self.line(x, y, x + 2, y, r, g, b)
-            self.line(x, y + 2, x + 2, y + 2, r, g, b)
-            self.line(x, y + 4, x + 2, y + 4, r, g, b)
-            self.set_color(x, y + 1, r, g, b)
-            self.set_color(x + 2, y + 3, r, g, b)
-        elif n == 6:
-            self.line(x, y, x + 2, y, r, g, b)
-            self.line(x, y + 2, x + 2, y + 2, r, g, b)
-            self.line(x, y + 4, x + 2, y + 4, r, g, b)
-            self.set_color(x, y + 1, r, g, b)
-            self.set_color(x + 2, y + 3, r, g, b)
-            self.set_color(x, y + 3, r, g, b)
-        elif n == 7:
-            self.line(x + 1, y + 2, x + 1, y + 4, r, g, b)
-            self.line(x, y, x + 2, y, r, g, b)
-            self.set_color(x + 2, y + 1, r, g, b)
-        elif n == 8:
-            self.line(x, y, x + 2, y, r, g, b)
-            self.line(x, y + 2, x + 2, y + 2, r, g, b)
-            self.line(x, y + 4, x + 2, y + 4, r, g, b)
-            self.set_color(x, y + 1, r, g, b)
-            self.set_color(x + 2, y + 1, r, g, b)
-            self.set_color(x + 2, y + 3, r, g, b)
-            self.set_color(x, y + 3, r, g, b)
-        elif n == 9:
-            self.line(x, y, x + 2, y, r, g, b)
-            self.line(x, y + 2, x + 2, y + 2, r, g, b)
-            self.line(x, y + 4, x + 2, y + 4, r, g, b)
-            self.set_color(x, y + 1, r, g, b)
-            self.set_color(x + 2, y + 1, r, g, b)
-            self.set_color(x + 2, y + 3, r, g, b)
+        if not 0 <= n <= 9:
+            return
+
+        if self._max_rgb_value != 255:
+            lut = self._remap_lut
+            r, g, b = lut[r], lut[g], lut[b]
+
+        set_color_raw = self._set_color_raw
+        glyph = _DIGITS[n]
+        for i in range(15):
+            if glyph & (0x4000 >> i):
+                set_color_raw(x + i % 3, y + i // 3, r, g, b)
 
     def rectangle(
         self, x1: int, y1: int, x2: int, y2: int, r: int, g: int, b: int
@@ -537,13 +665,47 @@ class BlinkStickProMatrix(BlinkStickPro):
         @param b: blue color byte
         """
 
-        self.line(x1, y1, x1, y2, r, g, b)
-        self.line(x1, y1, x2, y1, r, g, b)
-        self.line(x2, y1, x2, y2, r, g, b)
-        self.line(x1, y2, x2, y2, r, g, b)
+        if self._max_rgb_value != 255:
+            lut = self._remap_lut
+            r, g, b = lut[r], lut[g], lut[b]
+
+        x1, x2 = min(x1, x2), max(x1, x2)
+        y1, y2 = min(y1, y2), max(y1, y2)
+
+        cols = self.cols
+        # slice assignment would resize the buffer rather than fail, so check
+        # the corners up front
+        if x1 < 0 or y1 < 0 or x2 >= cols or y2 >= self.rows:
+            raise IndexError(
+                "Rectangle ({0}, {1})-({2}, {3}) is outside the {4}x{5} matrix".format(
+                    x1, y1, x2, y2, cols, self.rows
+                )
+            )
+
+        matrix_data = self.matrix_data
+        pixel = bytes((g, r, b))
+
+        # the top and bottom edges are contiguous in the matrix
+        edge = pixel * (x2 - x1 + 1)
+        for y in (y1, y2):
+            start = (y * cols + x1) * 3
+            matrix_data[start : start + len(edge)] = edge
+
+        for y in range(y1 + 1, y2):
+            for x in (x1, x2):
+                start = (y * cols + x) * 3
+                matrix_data[start : start + 3] = pixel
 
     def line(
-        self, x1: int, y1: int, x2: int, y2: int, r: int, g: int, b: int
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        r: int,
+        g: int,
+        b: int,
+        return_points: bool = True,
     ) -> list[tuple[int, int]]:
         """
         Draw a line from x1:y1 and x2:y2
@@ -562,7 +724,19 @@ class BlinkStickProMatrix(BlinkStickPro):
         @param g: green color byte
         @type b: int
         @param b: blue color byte
-        """
+        @type return_points: bool
+        @param return_points: collect the drawn points to return
+        @rtype: list[(int, int)]
+        @return: the x, y points of the line from x1:y1 to x2:y2, or an empty
+            list if return_points is False
+        """
+        # remap once for the whole line rather than once per pixel
+        if self._max_rgb_value != 255:
+            lut = self._remap_lut
+            r, g, b = lut[r], lut[g], lut[b]
+
+        matrix_data = self.matrix_data
+        cols = self.cols
         points = []
         is_steep = abs(y2 - y1) > abs(x2 - x1)
         if is_steep:
@@ -575,7 +749,7 @@ class BlinkStickProMatrix(BlinkStickPro):
             rev = True
         delta_x = x2 - x1
         delta_y = abs(y2 - y1)
-        error = int(delta_x / 2)
+        error = delta_x >> 1
         y = y1
         y_step = None
 
@@ -585,18 +759,20 @@ class BlinkStickProMatrix(BlinkStickPro):
             y_step = -1
         for x in range(x1, x2 + 1):
             if is_steep:
-                # print y, "~", x
-                self.set_color(y, x, r, g, b)
-                points.append((y, x))
+                point_x, point_y = y, x
             else:
-                # print x, " ", y
-                self.set_color(x, y, r, g, b)
-                points.append((x, y))
+                point_x, point_y = x, y
+            offset = (point_y * cols + point_x) * 3
+            matrix_data[offset] = g
+            matrix_data[offset + 1] = r
+            matrix_data[offset + 2] = b
+            if return_points:
+                points.append((point_x, point_y))
             error -= delta_y
             if error < 0:
                 y += y_step
                 error += delta_x
-                # Reverse the list if the coordinates were reversed
+        # Reverse the list if the coordinates were reversed
         if rev:
             points.reverse()
         return points
@@ -605,13 +781,11 @@ class BlinkStickProMatrix(BlinkStickPro):
         """
         Set all pixels to black in the cached matrix
         """
-        for y in range(0, self.rows):
-            for x in range(0, self.cols):
-                self.set_color(x, y, 0, 0, 0)
+        self.matrix_data[:] = bytes(len(self.matrix_data))
 
-    def send_data(self, channel: int) -> None:
+    def _send_data(self, channel: Channel) -> bool:
         """
-        Send data stored in the internal buffer to the channel.
+        Slice the matrix into the channel's buffer and send it to the channel.
 
         @param channel:
             - 0 - R pin on BlinkStick Pro board
@@ -619,28 +793,17 @@ class BlinkStickProMatrix(BlinkStickPro):
             - 2 - B pin on BlinkStick Pro board
         """
 
-        start_col = 0
-        end_col = 0
-
-        if channel == 0:
-            start_col = 0
-            end_col = self.r_columns
-
-        if channel == 1:
-            start_col = self.r_columns
-            end_col = start_col + self.g_columns
-
-        if channel == 2:
-            start_col = self.r_columns + self.g_columns
-            end_col = start_col + self.b_columns
-
-        self.data[channel] = []
+        start_col, end_col = self._channel_bounds[channel]
+        row_length = (end_col - start_col) * 3
+        data = self.data[channel]
+        matrix_view = memoryview(self.matrix_data)
 
         # slice the huge array to individual packets
+        cursor = 0
         for y in range(0, self.rows):
-            start = y * self.cols + start_col
-            end = y * self.cols + end_col
+            start = (y * self.cols + start_col) * 3
 
-            self.data[channel].extend(self.matrix_data[start:end])
+            data[cursor : cursor + row_length] = matrix_view[start : start + row_length]
+            cursor += row_length
 
-        super(BlinkStickProMatrix, self).send_data(channel)
+        return super(BlinkStickProMatrix, self)._send_data(channel)
@@ -1,16 +1,52 @@
 from __future__ import annotations
 
 import random
-import re
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
+from typing import Iterable
 
+from blinkstick.constants import DATACLASS_SLOTS
 from blinkstick.exceptions import RGBColorException
 
-HEX_COLOR_PATTERN = re.compile(r"^[0-9a-fA-F]{3}$|^[0-9a-fA-F]{6}$")
+HEX_DIGITS = "0123456789abcdefABCDEF"
 
 
-@dataclass()
+@lru_cache(maxsize=256)
+def _hex_to_rgb_tuple(hex_color: str) -> tuple[int, int, int]:
+    """
+    Parse a hex color string into its red, green and blue components.
+
+    Palettes tend to reuse the same few strings, so results are cached.
+    Invalid strings raise and are not cached.
+    """
+    # Remove leading '#' if present
+    if hex_color.startswith("#"):
+        hex_color = hex_color[1:]
+    # Must be 3 or 6 characters, all of them hex digits. int() alone would
+    # also accept signs, whitespace, underscores and a 0x prefix.
+    if len(hex_color) not in (3, 6) or hex_color.strip(HEX_DIGITS):
+        raise RGBColorException(
+            f"Invalid hex color: {hex_color}. Must be 3 or 6 hex characters."
+        )
+    value = int(hex_color, 16)
+    # Expand shorthand form (#rgb to #rrggbb) by repeating each nibble
+    if len(hex_color) == 3:
+        return (value >> 8) * 0x11, (value >> 4 & 0xF) * 0x11, (value & 0xF) * 0x11
+
+    return value >> 16, value >> 8 & 0xFF, value & 0xFF
+
+
+@lru_cache(maxsize=1024)
+def _rgb_to_hex(red: int, green: int, blue: int) -> str:
+    """
+    Format color components as a hex color string, caching the result.
+    """
+    # one format call on the packed value rather than three
+    return f"#{red << 16 | green << 8 | blue:06x}"
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RGBColor:
     """
     A color representation.
@@ -30,67 +66,127 @@ class RGBColor:
         :return:
         """
 
-        if not all(0 <= value <= 255 for value in (self.red, self.green, self.blue)):
+        # any bit above the low eight is set for values over 255, and for
+        # negative values since Python ints are infinitely sign-extended
+        try:
+            out_of_range = (self.red | self.green | self.blue) & ~0xFF
+        except TypeError:
+            raise RGBColorException("Color values must be integers") from None
+        if out_of_range:
             raise RGBColorException("Color values must be between 0 and 255")
 
+    @classmethod
+    def _unchecked(cls, red: int, green: int, blue: int) -> RGBColor:
+        """
+        Create a color without range validation, for internal callers whose
+        component values are already known to be within 0-255.
+        """
+        color = object.__new__(cls)
+        object.__setattr__(color, "red", red)
+        object.__setattr__(color, "green", green)
+        object.__setattr__(color, "blue", blue)
+        return color
+
     @property
     def hex(self) -> str:
         """
         Convert the Color object to a hex color string.
         """
-        return f"#{self.red:02x}{self.green:02x}{self.blue:02x}"
+        return _rgb_to_hex(self.red, self.green, self.blue)
+
+    @property
+    def as_bytes(self) -> bytes:
+        """
+        The color components packed as three bytes in RGB order.
+        """
+        return bytes((self.red, self.green, self.blue))
+
+    @staticmethod
+    def pack_many(colors: Iterable[RGBColor]) -> bytes:
+        """
+        Pack a sequence of colors into one RGB byte string.
+        """
+        return bytes(
+            [
+                value
+                for color in colors
+                for value in (color.red, color.green, color.blue)
+            ]
+        )
+
+    @property
+    def packet_bytes(self) -> bytes:
+        """
+        The color components packed as three bytes in the GRB order used by
+        LED data frames, see L{BlinkStick.set_led_data}.
+        """
+        return bytes((self.green, self.red, self.blue))
+
+    @staticmethod
+    def packet_bytes_many(colors: Iterable[RGBColor]) -> bytes:
+        """
+        Pack a sequence of colors into one GRB LED data frame.
+        """
+        frame = bytearray(RGBColor.pack_many(colors))
+        # swap the red and green byte of every LED in one pass per channel
+        frame[0::3], frame[1::3] = frame[1::3], frame[0::3]
+        return bytes(frame)
 
     def __iter__(self):
         """
         Iterate over the color components.
         """
-        yield self.red
-        yield self.green
-        yield self.blue
+        return iter((self.red, self.green, self.blue))
 
     def __invert__(self):
         """
         Invert the color.
         """
-        return RGBColor(
-            red=255 - self.red,
-            green=255 - self.green,
-            blue=255 - self.blue,
-        )
+        return _invert(self.red, self.green, self.blue)
 
     @classmethod
     def from_hex(cls, hex_color: str):
         """
         Create a Color object from a hex color string.
         """
-        # Remove leading '#' if present
-        if hex_color.startswith("#"):
-            hex_color = hex_color[1:]
-        # Validate with compiled regex - must be 3 or 6 hex characters
-        if not HEX_COLOR_PATTERN.match(hex_color):
+        return cls._unchecked(*_hex_to_rgb_tuple(hex_color))
+
+    @classmethod
+    def from_int(cls, value: int) -> RGBColor:
+        """
+        Create a Color object from a packed 0xRRGGBB integer.
+        """
+        if value & ~0xFFFFFF:
             raise RGBColorException(
-                f"Invalid hex color: {hex_color}. Must be 3 or 6 hex characters."
+                f"Invalid color value: {value}. Must be between 0x000000 and 0xFFFFFF."
             )
-        # Expand shorthand form (#rgb to #rrggbb)
-        if len(hex_color) == 3:
-            hex_color = "".join(c + c for c in hex_color)
-
-        return cls(
-            red=int(hex_color[0:2], 16),
-            green=int(hex_color[2:4], 16),
-            blue=int(hex_color[4:6], 16),
-        )
+        return cls._unchecked(value >> 16, value >> 8 & 0xFF, value & 0xFF)
+
+    def to_int(self) -> int:
+        """
+        Convert the Color object to a packed 0xRRGGBB integer.
+        """
+        return self.red << 16 | self.green << 8 | self.blue
 
     @classmethod
     def random(cls):
         """
         Generate a random color.
         """
-        return cls(
-            red=random.randint(0, 255),
-            green=random.randint(0, 255),
-            blue=random.randint(0, 255),
-        )
+        # one 24 bit draw covers all three components
+        value = random.getrandbits(24)
+        return cls._unchecked(value >> 16, value >> 8 & 0xFF, value & 0xFF)
+
+    @classmethod
+    def random_many(cls, count: int) -> list[RGBColor]:
+        """
+        Generate a list of random colors from a single random draw.
+        """
+        data = random.randbytes(count * 3)
+        return [
+            cls._unchecked(data[i], data[i + 1], data[i + 2])
+            for i in range(0, count * 3, 3)
+        ]
 
     def remap_to_new_range(self, max_value: int) -> "RGBColor":
         """
@@ -104,171 +200,238 @@ class RGBColor:
         """
 
         # first clamp the new range between 0-255
-        max_value = max(0, min(max_value, 255))
+        if max_value < 0:
+            max_value = 0
+        elif max_value > 255:
+            max_value = 255
 
-        def remap_component(value: int) -> int:
-            # Convert from 0-255 range to 0-max_value range
-            return int((value / 255.0) * max_value)
+        # Convert from 0-255 range to 0-max_value range with the cached table
+        table = _remap_table(max_value)
+        return RGBColor._unchecked(table[self.red], table[self.green], table[self.blue])
 
-        return RGBColor(
-            red=remap_component(self.red),
-            green=remap_component(self.green),
-            blue=remap_component(self.blue),
-        )
+
+@lru_cache(maxsize=512)
+def _invert(red: int, green: int, blue: int) -> RGBColor:
+    """
+    Build the inverse of a color. RGBColor is immutable, so the result can be
+    shared between calls.
+    """
+    return RGBColor._unchecked(255 - red, 255 - green, 255 - blue)
+
+
+@lru_cache(maxsize=32)
+def _remap_table(max_value: int) -> bytes:
+    """
+    Build the 256 byte table mapping each 0-255 value to the 0-max_value range.
+    A session only uses a handful of brightness limits, so tables are cached.
+    """
+    return bytes(value * max_value // 255 for value in range(256))
+
+
+def remap_rgb_bytes(data: bytes | bytearray | memoryview, max_value: int) -> bytes:
+    """
+    Remap a whole buffer of packed color components, e.g. from
+    L{RGBColor.pack_many}, to the 0-max_value range in one pass.
+
+    :param data: color components, one byte each
+    :param max_value: The maximum value in the target range (0-255)
+    :return: the remapped components, matching remap_to_new_range per color
+    """
+    max_value = max(0, min(max_value, 255))
+    return bytes(data).translate(_remap_table(max_value))
 
 
 class NamedColor(Enum):
-    ALICEBLUE = RGBColor(red=240, green=248, blue=255)
-    ANTIQUEWHITE = RGBColor(red=250, green=235, blue=215)
-    AQUA = RGBColor(red=0, green=255, blue=255)
-    AQUAMARINE = RGBColor(red=127, green=255, blue=212)
-    AZURE = RGBColor(red=240, green=255, blue=255)
-    BEIGE = RGBColor(red=245, green=245, blue=220)
-    BISQUE = RGBColor(red=255, green=228, blue=196)
-    BLACK = RGBColor(red=0, green=0, blue=0)
-    BLANCHEDALMOND = RGBColor(red=255, green=235, blue=205)
-    BLUE = RGBColor(red=0, green=0, blue=255)
-    BLUEVIOLET = RGBColor(red=138, green=43, blue=226)
-    BROWN = RGBColor(red=165, green=42, blue=42)
-    BURLYWOOD = RGBColor(red=222, green=184, blue=135)
-    CADETBLUE = RGBColor(red=95, green=158, blue=160)
-    CHARTREUSE = RGBColor(red=127, green=255, blue=0)
-    CHOCOLATE = RGBColor(red=210, green=105, blue=30)
-    CORAL = RGBColor(red=255, green=127, blue=80)
-    CORNFLOWERBLUE = RGBColor(red=100, green=149, blue=237)
-    CORNSILK = RGBColor(red=255, green=248, blue=220)
-    CRIMSON = RGBColor(red=220, green=20, blue=60)
-    CYAN = RGBColor(red=0, green=255, blue=255)
-    DARKBLUE = RGBColor(red=0, green=0, blue=139)
-    DARKCYAN = RGBColor(red=0, green=139, blue=139)
-    DARKGOLDENROD = RGBColor(red=184, green=134, blue=11)
-    DARKGRAY = RGBColor(red=169, green=169, blue=169)
-    DARKGREY = RGBColor(red=169, green=169, blue=169)
-    DARKGREEN = RGBColor(red=0, green=100, blue=0)
-    DARKKHAKI = RGBColor(red=189, green=183, blue=107)
-    DARKMAGENTA = RGBColor(red=139, green=0, blue=139)
-    DARKOLIVEGREEN = RGBColor(red=85, green=107, blue=47)
-    DARKORANGE = RGBColor(red=255, green=140, blue=0)
-    DARKORCHID = RGBColor(red=153, green=50, blue=204)
-    DARKRED = RGBColor(red=139, green=0, blue=0)
-    DARKSALMON = RGBColor(red=233, green=150, blue=122)
-    DARKSEAGREEN = RGBColor(red=143, green=188, blue=143)
-    DARKSLATEBLUE = RGBColor(red=72, green=61, blue=139)
-    DARKSLATEGRAY = RGBColor(red=47, green=79, blue=79)
-    DARKSLATEGREY = RGBColor(red=47, green=79, blue=79)
-    DARKTURQUOISE = RGBColor(red=0, green=206, blue=209)
-    DARKVIOLET = RGBColor(red=148, green=0, blue=211)
-    DEEPPINK = RGBColor(red=255, green=20, blue=147)
-    DEEPSKYBLUE = RGBColor(red=0, green=191, blue=255)
-    DIMGRAY = RGBColor(red=105, green=105, blue=105)
-    DIMGREY = RGBColor(red=105, green=105, blue=105)
-    DODGERBLUE = RGBColor(red=30, green=144, blue=255)
-    FIREBRICK = RGBColor(red=178, green=34, blue=34)
-    FLORALWHITE = RGBColor(red=255, green=250, blue=240)
-    FORESTGREEN = RGBColor(red=34, green=139, blue=34)
-    FUCHSIA = RGBColor(red=255, green=0, blue=255)
-    GAINSBORO = RGBColor(red=220, green=220, blue=220)
-    GHOSTWHITE = RGBColor(red=248, green=248, blue=255)
-    GOLD = RGBColor(red=255, green=215, blue=0)
-    GOLDENROD = RGBColor(red=218, green=165, blue=32)
-    GRAY = RGBColor(red=128, green=128, blue=128)
-    GREY = RGBColor(red=128, green=128, blue=128)
-    GREEN = RGBColor(red=0, green=128, blue=0)
-    GREENYELLOW = RGBColor(red=173, green=255, blue=47)
-    HONEYDEW = RGBColor(red=240, green=255, blue=240)
-    HOTPINK = RGBColor(red=255, green=105, blue=180)
-    INDIANRED = RGBColor(red=205, green=92, blue=92)
-    INDIGO = RGBColor(red=75, green=0, blue=130)
-    IVORY = RGBColor(red=255, green=255, blue=240)
-    KHAKI = RGBColor(red=240, green=230, blue=140)
-    LAVENDER = RGBColor(red=230, green=230, blue=250)
-    LAVENDERBLUSH = RGBColor(red=255, green=240, blue=245)
-    LAWNGREEN = RGBColor(red=124, green=252, blue=0)
-    LEMONCHIFFON = RGBColor(red=255, green=250, blue=205)
-    LIGHTBLUE = RGBColor(red=173, green=216, blue=230)
-    LIGHTCORAL = RGBColor(red=240, green=128, blue=128)
-    LIGHTCYAN = RGBColor(red=224, green=255, blue=255)
-    LIGHTGOLDENRODYELLOW = RGBColor(red=250, green=250, blue=210)
-    LIGHTGRAY = RGBColor(red=211, green=211, blue=211)
-    LIGHTGREY = RGBColor(red=211, green=211, blue=211)
-    LIGHTGREEN = RGBColor(red=144, green=238, blue=144)
-    LIGHTPINK = RGBColor(red=255, green=182, blue=193)
-    LIGHTSALMON = RGBColor(red=255, green=160, blue=122)
-    LIGHTSEAGREEN = RGBColor(red=32, green=178, blue=170)
-    LIGHTSKYBLUE = RGBColor(red=135, green=206, blue=250)
-    LIGHTSLATEGRAY = RGBColor(red=119, green=136, blue=153)
-    LIGHTSLATEGREY = RGBColor(red=119, green=136, blue=153)
-    LIGHTSTEELBLUE = RGBColor(red=176, green=196, blue=222)
-    LIGHTYELLOW = RGBColor(red=255, green=255, blue=224)
-    LIME = RGBColor(red=0, green=255, blue=0)
-    LIMEGREEN = RGBColor(red=50, green=205, blue=50)
-    LINEN = RGBColor(red=250, green=240, blue=230)
-    MAGENTA = RGBColor(red=255, green=0, blue=255)
-    MAROON = RGBColor(red=128, green=0, blue=0)
-    MEDIUMAQUAMARINE = RGBColor(red=102, green=205, blue=170)
-    MEDIUMBLUE = RGBColor(red=0, green=0, blue=205)
-    MEDIUMORCHID = RGBColor(red=186, green=85, blue=211)
-    MEDIUMPURPLE = RGBColor(red=147, green=112, blue=216)
-    MEDIUMSEAGREEN = RGBColor(red=60, green=179, blue=113)
-    MEDIUMSLATEBLUE = RGBColor(red=123, green=104, blue=238)
-    MEDIUMSPRINGGREEN = RGBColor(red=0, green=250, blue=154)
-    MEDIUMTURQUOISE = RGBColor(red=72, green=209, blue=204)
-    MEDIUMVIOLETRED = RGBColor(red=199, green=21, blue=133)
-    MIDNIGHTBLUE = RGBColor(red=25, green=25, blue=112)
-    MINTCREAM = RGBColor(red=245, green=255, blue=250)
-    MISTYROSE = RGBColor(red=255, green=228, blue=225)
-    MOCCASIN = RGBColor(red=255, green=228, blue=181)
-    NAVAJOWHITE = RGBColor(red=255, green=222, blue=173)
-    NAVY = RGBColor(red=0, green=0, blue=128)
-    OLDLACE = RGBColor(red=253, green=245, blue=230)
-    OLIVE = RGBColor(red=128, green=128, blue=0)
-    OLIVEDRAB = RGBColor(red=107, green=142, blue=35)
-    ORANGE = RGBColor(red=255, green=165, blue=0)
-    ORANGERED = RGBColor(red=255, green=69, blue=0)
-    ORCHID = RGBColor(red=218, green=112, blue=214)
-    PALEGOLDENROD = RGBColor(red=238, green=232, blue=170)
-    PALEGREEN = RGBColor(red=152, green=251, blue=152)
-    PALETURQUOISE = RGBColor(red=175, green=238, blue=238)
-    PALEVIOLETRED = RGBColor(red=216, green=112, blue=147)
-    PAPAYAWHIP = RGBColor(red=255, green=239, blue=213)
-    PEACHPUFF = RGBColor(red=255, green=218, blue=185)
-    PERU = RGBColor(red=205, green=133, blue=63)
-    PINK = RGBColor(red=255, green=192, blue=203)
-    PLUM = RGBColor(red=221, green=160, blue=221)
-    POWDERBLUE = RGBColor(red=176, green=224, blue=230)
-    PURPLE = RGBColor(red=128, green=0, blue=128)
-    RED = RGBColor(red=255, green=0, blue=0)
-    ROSYBROWN = RGBColor(red=188, green=143, blue=143)
-    ROYALBLUE = RGBColor(red=65, green=105, blue=225)
-    SADDLEBROWN = RGBColor(red=139, green=69, blue=19)
-    SALMON = RGBColor(red=250, green=128, blue=114)
-    SANDYBROWN = RGBColor(red=244, green=164, blue=96)
-    SEAGREEN = RGBColor(red=46, green=139, blue=87)
-    SEASHELL = RGBColor(red=255, green=245, blue=238)
-    SIENNA = RGBColor(red=160, green=82, blue=45)
-    SILVER = RGBColor(red=192, green=192, blue=192)
-    SKYBLUE = RGBColor(red=135, green=206, blue=235)
-    SLATEBLUE = RGBColor(red=106, green=90, blue=205)
-    SLATEGRAY = RGBColor(red=112, green=128, blue=144)
-    SLATEGREY = RGBColor(red=112, green=128, blue=144)
-    SNOW = RGBColor(red=255, green=250, blue=250)
-    SPRINGGREEN = RGBColor(red=0, green=255, blue=127)
-    STEELBLUE = RGBColor(red=70, green=130, blue=180)
-    TAN = RGBColor(red=210, green=180, blue=140)
-    TEAL = RGBColor(red=0, green=128, blue=128)
-    THISTLE = RGBColor(red=216, green=191, blue=216)
-    TOMATO = RGBColor(red=255, green=99, blue=71)
-    TURQUOISE = RGBColor(red=64, green=224, blue=208)
-    VIOLET = RGBColor(red=238, green=130, blue=238)
-    WHEAT = RGBColor(red=245, green=222, blue=179)
-    WHITE = RGBColor(red=255, green=255, blue=255)
-    WHITESMOKE = RGBColor(red=245, green=245, blue=245)
-    YELLOW = RGBColor(red=255, green=255, blue=0)
-    YELLOWGREEN = RGBColor(red=154, green=205, blue=50)
+    """
+    The W3C named colors. Each member's value is its L{RGBColor}.
+    """
+
+    _value_: RGBColor
+
+    def __new__(cls, red: int, green: int, blue: int) -> NamedColor:
+        # the table below is known to be in range, so skip validation
+        member = object.__new__(cls)
+        member._value_ = RGBColor._unchecked(red, green, blue)
+        return member
+
+    ALICEBLUE = 240, 248, 255
+    ANTIQUEWHITE = 250, 235, 215
+    AQUA = 0, 255, 255
+    AQUAMARINE = 127, 255, 212
+    AZURE = 240, 255, 255
+    BEIGE = 245, 245, 220
+    BISQUE = 255, 228, 196
+    BLACK = 0, 0, 0
+    BLANCHEDALMOND = 255, 235, 205
+    BLUE = 0, 0, 255
+    BLUEVIOLET = 138, 43, 226
+    BROWN = 165, 42, 42
+    BURLYWOOD = 222, 184, 135
+    CADETBLUE = 95, 158, 160
+    CHARTREUSE = 127, 255, 0
+    CHOCOLATE = 210, 105, 30
+    CORAL = 255, 127, 80
+    CORNFLOWERBLUE = 100, 149, 237
+    CORNSILK = 255, 248, 220
+    CRIMSON = 220, 20, 60
+    CYAN = 0, 255, 255
+    DARKBLUE = 0, 0, 139
+    DARKCYAN = 0, 139, 139
+    DARKGOLDENROD = 184, 134, 11
+    DARKGRAY = 169, 169, 169
+    DARKGREY = 169, 169, 169
+    DARKGREEN = 0, 100, 0
+    DARKKHAKI = 189, 183, 107
+    DARKMAGENTA = 139, 0, 139
+    DARKOLIVEGREEN = 85, 107, 47
+    DARKORANGE = 255, 140, 0
+    DARKORCHID = 153, 50, 204
+    DARKRED = 139, 0, 0
+    DARKSALMON = 233, 150, 122
+    DARKSEAGREEN = 143, 188, 143
+    DARKSLATEBLUE = 72, 61, 139
+    DARKSLATEGRAY = 47, 79, 79
+    DARKSLATEGREY = 47, 79, 79
+    DARKTURQUOISE = 0, 206, 209
+    DARKVIOLET = 148, 0, 211
+    DEEPPINK = 255, 20, 147
+    DEEPSKYBLUE = 0, 191, 255
+    DIMGRAY = 105, 105, 105
+    DIMGREY = 105, 105, 105
+    DODGERBLUE = 30, 144, 255
+    FIREBRICK = 178, 34, 34
+    FLORALWHITE = 255, 250, 240
+    FORESTGREEN = 34, 139, 34
+    FUCHSIA = 255, 0, 255
+    GAINSBORO = 220, 220, 220
+    GHOSTWHITE = 248, 248, 255
+    GOLD = 255, 215, 0
+    GOLDENROD = 218, 165, 32
+    GRAY = 128, 128, 128
+    GREY = 128, 128, 128
+    GREEN = 0, 128, 0
+    GREENYELLOW = 173, 255, 47
+    HONEYDEW = 240, 255, 240
+    HOTPINK = 255, 105, 180
+    INDIANRED = 205, 92, 92
+    INDIGO = 75, 0, 130
+    IVORY = 255, 255, 240
+    KHAKI = 240, 230, 140
+    LAVENDER = 230, 230, 250
+    LAVENDERBLUSH = 255, 240, 245
+    LAWNGREEN = 124, 252, 0
+    LEMONCHIFFON = 255, 250, 205
+    LIGHTBLUE = 173, 216, 230
+    LIGHTCORAL = 240, 128, 128
+    LIGHTCYAN = 224, 255, 255
+    LIGHTGOLDENRODYELLOW = 250, 250, 210
+    LIGHTGRAY = 211, 211, 211
+    LIGHTGREY = 211, 211, 211
+    LIGHTGREEN = 144, 238, 144
+    LIGHTPINK = 255, 182, 193
+    LIGHTSALMON = 255, 160, 122
+    LIGHTSEAGREEN = 32, 178, 170
+    LIGHTSKYBLUE = 135, 206, 250
+    LIGHTSLATEGRAY = 119, 136, 153
+    LIGHTSLATEGREY = 119, 136, 153
+    LIGHTSTEELBLUE = 176, 196, 222
+    LIGHTYELLOW = 255, 255, 224
+    LIME = 0, 255, 0
+    LIMEGREEN = 50, 205, 50
+    LINEN = 250, 240, 230
+    MAGENTA = 255, 0, 255
+    MAROON = 128, 0, 0
+    MEDIUMAQUAMARINE = 102, 205, 170
+    MEDIUMBLUE = 0, 0, 205
+    MEDIUMORCHID = 186, 85, 211
+    MEDIUMPURPLE = 147, 112, 216
+    MEDIUMSEAGREEN = 60, 179, 113
+    MEDIUMSLATEBLUE = 123, 104, 238
+    MEDIUMSPRINGGREEN = 0, 250, 154
+    MEDIUMTURQUOISE = 72, 209, 204
+    MEDIUMVIOLETRED = 199, 21, 133
+    MIDNIGHTBLUE = 25, 25, 112
+    MINTCREAM = 245, 255, 250
+    MISTYROSE = 255, 228, 225
+    MOCCASIN = 255, 228, 181
+    NAVAJOWHITE = 255, 222, 173
+    NAVY = 0, 0, 128
+    OLDLACE = 253, 245, 230
+    OLIVE = 128, 128, 0
+    OLIVEDRAB = 107, 142, 35
+    ORANGE = 255, 165, 0
+    ORANGERED = 255, 69, 0
+    ORCHID = 218, 112, 214
+    PALEGOLDENROD = 238, 232, 170
+    PALEGREEN = 152, 251, 152
+    PALETURQUOISE = 175, 238, 238
+    PALEVIOLETRED = 216, 112, 147
+    PAPAYAWHIP = 255, 239, 213
+    PEACHPUFF = 255, 218, 185
+    PERU = 205, 133, 63
+    PINK = 255, 192, 203
+    PLUM = 221, 160, 221
+    POWDERBLUE = 176, 224, 230
+    PURPLE = 128, 0, 128
+    RED = 255, 0, 0
+    ROSYBROWN = 188, 143, 143
+    ROYALBLUE = 65, 105, 225
+    SADDLEBROWN = 139, 69, 19
+    SALMON = 250, 128, 114
+    SANDYBROWN = 244, 164, 96
+    SEAGREEN = 46, 139, 87
+    SEASHELL = 255, 245, 238
+    SIENNA = 160, 82, 45
+    SILVER = 192, 192, 192
+    SKYBLUE = 135, 206, 235
+    SLATEBLUE = 106, 90, 205
+    SLATEGRAY = 112, 128, 144
+    SLATEGREY = 112, 128, 144
+    SNOW = 255, 250, 250
+    SPRINGGREEN = 0, 255, 127
+    STEELBLUE = 70, 130, 180
+    TAN = 210, 180, 140
+    TEAL = 0, 128, 128
+    THISTLE = 216, 191, 216
+    TOMATO = 255, 99, 71
+    TURQUOISE = 64, 224, 208
+    VIOLET = 238, 130, 238
+    WHEAT = 245, 222, 179
+    WHITE = 255, 255, 255
+    WHITESMOKE = 245, 245, 245
+    YELLOW = 255, 255, 0
+    YELLOWGREEN = 154, 205, 50
 
     @classmethod
     def from_name(cls, name):
         try:
-            return cls[name.upper()]
+            return _lookup_named_color(name)
         except KeyError:
             raise ValueError(f"'{name}' is not defined as a named color.")
+
+    @classmethod
+    def name_for(cls, color: RGBColor) -> str | None:
+        """
+        Get the name of a color, if it is one of the named colors.
+
+        Where several names share a value, e.g. GRAY and GREY, the first
+        declared name is returned.
+        """
+        return _RGB_TO_NAME.get(color)
+
+
+# plain dict lookup for from_name, including aliases such as CYAN for AQUA
+_NAMED_COLORS: dict[str, NamedColor] = dict(NamedColor.__members__)
+
+
+@lru_cache(maxsize=256)
+def _lookup_named_color(name: str) -> NamedColor:
+    """
+    Case-insensitive named color lookup, cached on the name as given so
+    repeated lookups skip the upper-casing too.
+    """
+    return _NAMED_COLORS[name.upper()]
+
+
+# reverse lookup for name_for; iterating the enum skips aliases
+_RGB_TO_NAME: dict[RGBColor, str] = {color.value: color.name for color in NamedColor}
@@ -1,2 +1,7 @@
+import sys
+
 VENDOR_ID = 0x20A0
 PRODUCT_ID = 0x41E5
+
+# dataclass only grew the slots option in Python 3.10
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-import sys
+from functools import lru_cache
 from importlib.metadata import version
 from typing import TYPE_CHECKING
 
-
-if sys.platform == "win32":
-    from blinkstick.backends.win32 import Win32Backend as USBBackend
-else:
-    from blinkstick.backends.unix_like import UnixLikeBackend as USBBackend
+from blinkstick.backends import get_usb_backend
 
 if TYPE_CHECKING:
     from blinkstick.clients import BlinkStick
@@ -23,13 +19,11 @@ def find_all() -> list[BlinkStick]:
     """
     from blinkstick.clients import BlinkStick
 
-    result: list[BlinkStick] = []
-    if (found_devices := USBBackend.get_attached_blinkstick_devices()) is None:
-        return result
-    for d in found_devices:
-        result.extend([BlinkStick(device=d)])
+    found_devices = get_usb_backend().get_attached_blinkstick_devices()
+    if not found_devices:
+        return []
 
-    return result
+    return [BlinkStick(device=d) for d in found_devices]
 
 
 def find_first() -> BlinkStick | None:
@@ -41,7 +35,9 @@ def find_first() -> BlinkStick | None:
     """
     from blinkstick.clients import BlinkStick
 
-    blinkstick_devices = USBBackend.get_attached_blinkstick_devices(find_all=False)
+    blinkstick_devices = get_usb_backend().get_attached_blinkstick_devices(
+        find_all=False
+    )
 
     if blinkstick_devices:
         return BlinkStick(device=blinkstick_devices[0])
@@ -56,8 +52,9 @@ def find_by_serial(serial: str = "") -> BlinkStick | None:
     @rtype: BlinkStick
     @return: BlinkStick object or None if no devices are found
     """
+    from blinkstick.clients import BlinkStick
 
-    devices = USBBackend.find_by_serial(serial=serial)
+    devices = get_usb_backend().find_by_serial(serial=serial)
 
     if devices:
         return BlinkStick(device=devices[0])
@@ -65,5 +62,6 @@ def find_by_serial(serial: str = "") -> BlinkStick | None:
     return None
 
 
+@lru_cache(maxsize=None)
 def get_blinkstick_package_version() -> str:
     return version("blinkstick")
@@ -1,13 +1,17 @@
+from __future__ import annotations
+
+import sys
 from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 
+from blinkstick.constants import DATACLASS_SLOTS
 from blinkstick.enums import BlinkStickVariant
 from blinkstick.models import SerialDetails
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(init=False, **DATACLASS_SLOTS)
 class BlinkStickDevice(Generic[T]):
     """A BlinkStick device representation"""
 
@@ -17,11 +21,41 @@ class BlinkStickDevice(Generic[T]):
     version_attribute: int
     description: str
     major_version: int = field(init=False)
-    variant: BlinkStickVariant = field(init=False)
-
-    def __post_init__(self):
-        self.major_version = self.serial_details.major_version
-        self.variant = BlinkStickVariant.from_version_attrs(
-            major_version=self.serial_details.major_version,
-            version_attribute=self.version_attribute,
-        )
+    _variant: BlinkStickVariant | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __init__(
+        self,
+        raw_device: T,
+        serial_details: SerialDetails,
+        manufacturer: str,
+        version_attribute: int,
+        description: str,
+    ):
+        # written out by hand so construction is a single frame, with no
+        # separate __post_init__ call for the derived fields
+        self.raw_device = raw_device
+        self.serial_details = serial_details
+        # every enumeration reads the same few strings back from the USB
+        # descriptors, so share one copy of each rather than one per device
+        self.manufacturer = sys.intern(manufacturer)
+        self.version_attribute = version_attribute
+        self.description = sys.intern(description)
+        self.major_version = serial_details.major_version
+        self._variant = None
+
+    @property
+    def variant(self) -> BlinkStickVariant:
+        """
+        The product variant, resolved on first access.
+
+        Enumeration creates a device for every attached BlinkStick, but usually
+        only the selected one is ever asked for its variant.
+        """
+        if self._variant is None:
+            self._variant = BlinkStickVariant.from_version_attrs(
+                major_version=self.major_version,
+                version_attribute=self.version_attribute,
+            )
+        return self._variant
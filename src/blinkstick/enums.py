@@ -1,43 +1,59 @@
 from __future__ import annotations
 
 from enum import Enum, IntEnum
+from functools import lru_cache
 
 
-class BlinkStickVariant(Enum):
-    UNKNOWN = (0, "Unknown")
-    BLINKSTICK = (1, "BlinkStick")
-    BLINKSTICK_PRO = (2, "BlinkStick Pro")
-    BLINKSTICK_STRIP = (3, "BlinkStick Strip")
-    BLINKSTICK_SQUARE = (4, "BlinkStick Square")
-    BLINKSTICK_NANO = (5, "BlinkStick Nano")
-    BLINKSTICK_FLEX = (6, "BlinkStick Flex")
+class BlinkStickVariant(IntEnum):
+    description: str
 
-    @property
-    def value(self) -> int:
-        return self._value_[0]
+    def __new__(cls, value: int, description: str) -> BlinkStickVariant:
+        # members are plain ints, with the display name carried alongside
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.description = description
+        return member
 
-    @property
-    def description(self) -> str:
-        return self._value_[1]
+    UNKNOWN = 0, "Unknown"
+    BLINKSTICK = 1, "BlinkStick"
+    BLINKSTICK_PRO = 2, "BlinkStick Pro"
+    BLINKSTICK_STRIP = 3, "BlinkStick Strip"
+    BLINKSTICK_SQUARE = 4, "BlinkStick Square"
+    BLINKSTICK_NANO = 5, "BlinkStick Nano"
+    BLINKSTICK_FLEX = 6, "BlinkStick Flex"
+
+    # keep the "BlinkStickVariant.NAME" rendering the tuple valued Enum had, which
+    # IntEnum replaces with the bare number on Python 3.11+ (and in format())
+    __str__ = Enum.__str__
+
+    def __format__(self, format_spec: str) -> str:
+        return str.__format__(str(self), format_spec)
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def from_version_attrs(
         major_version: int, version_attribute: int | None
     ) -> "BlinkStickVariant":
-        if major_version == 1:
-            return BlinkStickVariant.BLINKSTICK
-        elif major_version == 2:
-            return BlinkStickVariant.BLINKSTICK_PRO
-        elif major_version == 3:
-            if version_attribute == 0x200:
-                return BlinkStickVariant.BLINKSTICK_SQUARE
-            elif version_attribute == 0x201:
-                return BlinkStickVariant.BLINKSTICK_STRIP
-            elif version_attribute == 0x202:
-                return BlinkStickVariant.BLINKSTICK_NANO
-            elif version_attribute == 0x203:
-                return BlinkStickVariant.BLINKSTICK_FLEX
-        return BlinkStickVariant.UNKNOWN
+        if major_version == 3:
+            return _VERSION_ATTRIBUTE_VARIANTS.get(
+                version_attribute, BlinkStickVariant.UNKNOWN
+            )
+        return _MAJOR_VERSION_VARIANTS.get(major_version, BlinkStickVariant.UNKNOWN)
+
+
+# variants identified by the serial number's major version alone
+_MAJOR_VERSION_VARIANTS = {
+    1: BlinkStickVariant.BLINKSTICK,
+    2: BlinkStickVariant.BLINKSTICK_PRO,
+}
+
+# major version 3 devices are told apart by the USB version attribute
+_VERSION_ATTRIBUTE_VARIANTS: dict[int | None, BlinkStickVariant] = {
+    0x200: BlinkStickVariant.BLINKSTICK_SQUARE,
+    0x201: BlinkStickVariant.BLINKSTICK_STRIP,
+    0x202: BlinkStickVariant.BLINKSTICK_NANO,
+    0x203: BlinkStickVariant.BLINKSTICK_FLEX,
+}
 
 
 class Mode(IntEnum):
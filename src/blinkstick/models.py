@@ -1,8 +1,13 @@
 import re
 from dataclasses import dataclass, field
 
+from blinkstick.constants import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+# only used for serials the fast split in SerialDetails can't handle
+_SERIAL_NUMBER_RE = re.compile(r"BS(\d+)-(\d+)\.(\d+)")
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SerialDetails:
     """
     A BlinkStick serial number representation.
@@ -22,11 +27,21 @@ class SerialDetails:
     sequence_number: int = field(init=False)
 
     def __post_init__(self):
-        serial_number_regex = r"BS(\d+)-(\d+)\.(\d+)"
-        match = re.match(serial_number_regex, self.serial)
-        if not match:
-            raise ValueError(f"Invalid serial number: {self.serial}")
-
-        object.__setattr__(self, "sequence_number", int(match.group(1)))
-        object.__setattr__(self, "major_version", int(match.group(2)))
-        object.__setattr__(self, "minor_version", int(match.group(3)))
+        # split well-formed serials by hand, and only fall back to the regex,
+        # which also accepts trailing characters, when that fails
+        sequence_number, _, version = self.serial[2:].partition("-")
+        major_version, _, minor_version = version.partition(".")
+        if not (
+            self.serial.startswith("BS")
+            and sequence_number.isdecimal()
+            and major_version.isdecimal()
+            and minor_version.isdecimal()
+        ):
+            match = _SERIAL_NUMBER_RE.match(self.serial)
+            if not match:
+                raise ValueError(f"Invalid serial number: {self.serial}")
+            sequence_number, major_version, minor_version = match.groups()
+
+        object.__setattr__(self, "sequence_number", int(sequence_number))
+        object.__setattr__(self, "major_version", int(major_version))
+        object.__setattr__(self, "minor_version", int(minor_version))
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from blinkstick.colors import RGBColor, NamedColor
 
 
@@ -12,9 +14,12 @@ def string_to_info_block_data(data: str) -> bytes:
     @return: It fills the rest of bytes with zeros.
     """
     max_buffer_size = 31  # 31 bytes for the string + 1 byte for the prefix
-    return bytearray([0x01]) + data.encode("utf-8")[:max_buffer_size].ljust(
-        max_buffer_size, b"\x00"
-    )
+    encoded = data.encode("utf-8")[:max_buffer_size]
+    # the buffer is already zero filled, so only the prefix and string are written
+    buffer = bytearray(max_buffer_size + 1)
+    buffer[0] = 0x01
+    buffer[1 : len(encoded) + 1] = encoded
+    return bytes(buffer)
 
 
 def convert_to_rgb_color(color: RGBColor | NamedColor | str) -> RGBColor:
@@ -30,8 +35,17 @@ def convert_to_rgb_color(color: RGBColor | NamedColor | str) -> RGBColor:
     if isinstance(color, str):
         if color.lower() == "random":
             return RGBColor.random()
-        try:
-            return NamedColor.from_name(name=color).value
-        except ValueError:
-            return RGBColor.from_hex(str(color))
+        return _convert_str_to_rgb_color(color)
     return RGBColor(0, 0, 0)  # Default
+
+
+@lru_cache(maxsize=256)
+def _convert_str_to_rgb_color(color: str) -> RGBColor:
+    """
+    Resolve a colour name or hex string, cached so that a palette reused in a
+    loop skips the failed name lookup for every hex string.
+    """
+    try:
+        return NamedColor.from_name(name=color).value
+    except ValueError:
+        return RGBColor.from_hex(color)
@@ -1,92 +1,15 @@
 #!/usr/bin/env python3
 
-from optparse import OptionParser, IndentedHelpFormatter, OptionGroup
-import textwrap
+import argparse
 import sys
 import logging
 
-from blinkstick import (
-    find_all,
-    find_by_serial,
-    get_blinkstick_package_version,
-    BlinkStickVariant,
-)
-
 logging.basicConfig()
 
 
-class IndentedHelpFormatterWithNL(IndentedHelpFormatter):
-    def format_description(self, description):
-        if not description:
-            return ""
-
-        desc_width = self.width - self.current_indent
-        indent = " " * self.current_indent
-        # the above is still the same
-        bits = description.split("\n")
-        formatted_bits = [
-            textwrap.fill(
-                bit, desc_width, initial_indent=indent, subsequent_indent=indent
-            )
-            for bit in bits
-        ]
-        result = "\n".join(formatted_bits) + "\n"
-        return result
-
-    def format_option(self, option):
-        # The help for each option consists of two parts:
-        #   * the opt strings and metavars
-        #   eg. ("-x", or "-fFILENAME, --file=FILENAME")
-        #   * the user-supplied help string
-        #   eg. ("turn on expert mode", "read data from FILENAME")
-        #
-        # If possible, we write both of these on the same line:
-        #   -x    turn on expert mode
-        #
-        # But if the opt string list is too long, we put the help
-        # string on a second line, indented to the same column it would
-        # start in if it fit on the first line.
-        #   -fFILENAME, --file=FILENAME
-        #       read data from FILENAME
-        result = []
-        opts = self.option_strings[option]
-        opt_width = self.help_position - self.current_indent - 2
-
-        if len(opts) > opt_width:
-            opts = "%*s%s\n" % (self.current_indent, "", opts)
-            indent_first = self.help_position
-        else:  # start help on same line as opts
-            opts = "%*s%-*s  " % (self.current_indent, "", opt_width, opts)
-            indent_first = 0
-
-        result.append(opts)
-
-        if option.help:
-            help_text = self.expand_default(option)
-            # Everything is the same up through here
-            help_lines = []
-            for para in help_text.split("\n"):
-                help_lines.extend(textwrap.wrap(para, self.help_width))
-                # Everything is the same after here
-            result.append("%*s%s\n" % (indent_first, "", help_lines[0]))
-            result.extend(
-                ["%*s%s\n" % (self.help_position, "", line) for line in help_lines[1:]]
-            )
-        elif opts[-1] != "\n":
-            result.append("\n")
-        return "".join(result)
-
-    def format_usage(self, usage):
-        return (
-            "BlinkStick control script %s\n(c) Agile Innovative Ltd 2013-2014\n\n%s"
-            % (
-                get_blinkstick_package_version(),
-                IndentedHelpFormatter.format_usage(self, usage),
-            )
-        )
-
-
 def print_info(stick):
+    from blinkstick import BlinkStickVariant
+
     print("Found backend:")
     print("    Manufacturer:  {0}".format(stick.manufacturer))
     print("    Description:   {0}".format(stick.description))
@@ -107,26 +30,67 @@ def print_info(stick):
     print("    Info Block 2:  {0}".format(stick.info_block2))
 
 
-def main():
-    global options
-    global sticks
+# defaults for every option dest, set on the base parser so that main() can read
+# options from groups that were never attached to it
+_OPTION_DEFAULTS = {
+    "channel": 0,
+    "index": 0,
+    "limit": 100,
+    "color": None,
+    "inverse": False,
+    "led_count": None,
+    "blink": False,
+    "pulse": False,
+    "morph": False,
+    "duration": 1000,
+    "delay": 500,
+    "repeats": 1,
+    "mode": 0,
+    "infoblock1": None,
+    "infoblock2": None,
+    "udev": False,
+}
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    def format_help(self):
+        # the banner is only shown in help, so the package version is looked up
+        # here rather than on every run
+        from importlib.metadata import version
+
+        self.description = (
+            "BlinkStick control script %s\n(c) Agile Innovative Ltd 2013-2014"
+            % version("blinkstick")
+        )
+        return super().format_help()
+
+
+def _build_base_parser():
+    parser = _ArgumentParser(
+        prog="blinkstick",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.set_defaults(**_OPTION_DEFAULTS)
 
-    parser = OptionParser(
-        usage="usage: %prog [options] [color]", formatter=IndentedHelpFormatterWithNL()
+    parser.add_argument(
+        "positional_color",
+        nargs="?",
+        metavar="color",
+        help="The color to set, as an alternative to --set-color.",
     )
 
-    parser.add_option(
+    parser.add_argument(
         "-i", "--info", action="store_true", dest="info", help="Display BlinkStick info"
     )
 
-    parser.add_option(
+    parser.add_argument(
         "-s",
         "--serial",
         dest="serial",
         help="Select backend by serial number. If unspecified, action will be performed on all BlinkSticks.",
     )
 
-    parser.add_option(
+    parser.add_argument(
         "-v",
         "--verbose",
         action="store_true",
@@ -134,147 +98,236 @@ def main():
         help="Display debug output",
     )
 
-    group = OptionGroup(
-        parser, "Change color", "These options control the color of the backend  "
+    return parser
+
+
+def _add_color_group(parser):
+    group = parser.add_argument_group(
+        "Change color", "These options control the color of the backend"
     )
 
-    group.add_option(
+    group.add_argument(
         "--channel",
-        default=0,
         dest="channel",
         help="Select channel. Applies only to BlinkStick Pro.",
     )
 
-    group.add_option(
+    group.add_argument(
         "--index",
-        default=0,
         dest="index",
         help="Select index. Applies only to BlinkStick Pro.",
     )
 
-    group.add_option(
+    group.add_argument(
         "--brightness",
-        default=100,
         dest="limit",
         help="Limit the brightness of the color 0..100",
     )
 
-    group.add_option(
-        "--limit", default=100, dest="limit", help="Alias to --brightness option"
-    )
+    group.add_argument("--limit", dest="limit", help="Alias to --brightness option")
 
-    group.add_option(
+    group.add_argument(
         "--set-color",
         dest="color",
         help="Set the color for the backend. This can also be the last argument for the script. "
-        "The value can either be a named color, hex value, 'random' or 'off'.\n\n"
+        "The value can either be a named color, hex value, 'random' or 'off'. "
         "CSS color names are defined http://www.w3.org/TR/css3-color/ e.g. red, green, blue. "
         "Specify color using hexadecimal color value e.g. 'FF3366'",
     )
-    group.add_option(
+    group.add_argument(
         "--inverse",
         action="store_true",
         dest="inverse",
         help="Control BlinkSticks in inverse mode",
     )
 
-    group.add_option(
+    group.add_argument(
         "--set-led-count",
         dest="led_count",
         help="Set the number of LEDs to control for supported devices.",
     )
 
-    parser.add_option_group(group)
 
-    group = OptionGroup(
-        parser,
+def _add_animation_group(parser):
+    group = parser.add_argument_group(
         "Control animations",
-        "These options will blink, morph or pulse selected color.  ",
+        "These options will blink, morph or pulse selected color.",
     )
 
-    group.add_option(
+    group.add_argument(
         "--blink",
         dest="blink",
         action="store_true",
         help="Blink LED (requires --set-color or color set as last argument, and optionally --delay)",
     )
 
-    group.add_option(
+    group.add_argument(
         "--pulse",
         dest="pulse",
         action="store_true",
         help="Pulse LED (requires --set-color or color set as last argument, and optionally --duration).",
     )
 
-    group.add_option(
+    group.add_argument(
         "--morph",
         dest="morph",
         action="store_true",
         help="Morph to specified color (requires --set-color or color set as last argument, and optionally --duration).",
     )
 
-    group.add_option(
+    group.add_argument(
         "--duration",
         dest="duration",
-        default=1000,
         help="Set duration of transition in milliseconds (use with --morph and --pulse).",
     )
 
-    group.add_option(
+    group.add_argument(
         "--delay",
         dest="delay",
-        default=500,
         help="Set time in milliseconds to light LED for (use with --blink).",
     )
 
-    group.add_option(
+    group.add_argument(
         "--repeats",
         dest="repeats",
-        default=1,
         help="Number of repetitions (use with --blink and --pulse).",
     )
 
-    parser.add_option_group(group)
 
-    group = OptionGroup(
-        parser,
+def _add_device_group(parser):
+    group = parser.add_argument_group(
         "Device data and behaviour",
-        "These options will change backend mode and data stored internally.  ",
+        "These options will change backend mode and data stored internally.",
     )
 
-    group.add_option(
+    group.add_argument(
         "--set-mode",
-        default=0,
         dest="mode",
-        help="Set mode for BlinkStick Pro:\n\n    0 - default\n\n    1 - inverse\n\n    2 - ws2812\n\n    3 - ws2812 mirror",
+        choices=("0", "1", "2", "3"),
+        metavar="MODE",
+        help="Set mode for BlinkStick Pro: 0 - default, 1 - inverse, 2 - ws2812, 3 - ws2812 mirror",
     )
 
-    group.add_option(
+    group.add_argument(
         "--set-infoblock1",
         dest="infoblock1",
         help="Set the first info block for the backend.",
     )
 
-    group.add_option(
+    group.add_argument(
         "--set-infoblock2",
         dest="infoblock2",
         help="Set the second info block for the backend.",
     )
 
-    parser.add_option_group(group)
 
-    group = OptionGroup(parser, "Advanced options", "")
+def _add_advanced_group(parser):
+    group = parser.add_argument_group("Advanced options")
 
-    group.add_option(
+    group.add_argument(
         "--add-udev-rule",
         action="store_true",
         dest="udev",
         help="Add udev rule to access BlinkSticks without root permissions. Must be run as root e.g. `sudo $(which blinkstick) --add-udev-rule`.",
     )
 
-    parser.add_option_group(group)
 
-    (options, args) = parser.parse_args()
+# the long options each group adds, used to attach only the groups a command
+# line refers to; groups must stay in this order so --help output is unchanged
+_OPTION_GROUPS = (
+    (
+        _add_color_group,
+        (
+            "--channel",
+            "--index",
+            "--brightness",
+            "--limit",
+            "--set-color",
+            "--inverse",
+            "--set-led-count",
+        ),
+    ),
+    (
+        _add_animation_group,
+        ("--blink", "--pulse", "--morph", "--duration", "--delay", "--repeats"),
+    ),
+    (_add_device_group, ("--set-mode", "--set-infoblock1", "--set-infoblock2")),
+    (_add_advanced_group, ("--add-udev-rule",)),
+)
+_BASE_LONG_OPTIONS = ("--info", "--serial", "--verbose")
+
+
+def _used_option_groups(argv):
+    """
+    Find the option groups that argv refers to, as indices into _OPTION_GROUPS.
+
+    Long options may be abbreviated, so a group is used when an argument is a
+    prefix of any of its options. Help, and any long option that matches
+    nothing, use every group so the full help and usage are shown.
+    """
+    all_groups = set(range(len(_OPTION_GROUPS)))
+    used = set()
+    for arg in argv:
+        if arg == "--":
+            break
+        if not arg.startswith("-"):
+            continue
+        if not arg.startswith("--"):
+            # short options all belong to the base parser, apart from -h
+            if "h" in arg:
+                return all_groups
+            continue
+        name = arg.partition("=")[0]
+        if "--help".startswith(name):
+            return all_groups
+        matches = {
+            i
+            for i, (_, long_options) in enumerate(_OPTION_GROUPS)
+            if any(option.startswith(name) for option in long_options)
+        }
+        if not matches and not any(
+            option.startswith(name) for option in _BASE_LONG_OPTIONS
+        ):
+            return all_groups
+        used |= matches
+    return used
+
+
+def _build_parser(argv=None):
+    """
+    Build the option parser, with only the option groups argv uses, or with
+    every group when argv is None.
+    """
+    parser = _build_base_parser()
+    used = range(len(_OPTION_GROUPS)) if argv is None else _used_option_groups(argv)
+    for i, (add_group, _) in enumerate(_OPTION_GROUPS):
+        if i in used:
+            add_group(parser)
+    return parser
+
+
+def _parse_color(color):
+    """
+    Map a color argument to the color value accepted by the stick methods.
+    """
+    from blinkstick.colors import HEX_DIGITS
+
+    if color == "off":
+        return "#000000"
+    # a bare 6 digit hex value, e.g. FF3366
+    if len(color) == 6 and not color.strip(HEX_DIGITS):
+        return "#" + color
+    # names, "random" and "#" prefixed hex values are resolved by the stick
+    return color
+
+
+def main():
+    global options
+    global sticks
+
+    parser = _build_parser(sys.argv[1:])
+
+    options = parser.parse_args()
 
     # Global action
     if options.udev:
@@ -298,6 +351,10 @@ def main():
         print("Reboot your computer for changes to take effect")
         return 0
 
+    # only needed once there are sticks to talk to, so help, parse errors and
+    # --add-udev-rule don't pay for importing the package and its USB backend
+    from blinkstick import find_all, find_by_serial
+
     if options.serial is None:
         sticks = find_all()
     else:
@@ -307,14 +364,38 @@ def main():
             print("BlinkStick with serial number " + options.serial + " not found...")
             return 64
 
+    max_rgb_value = int(float(options.limit) / 100.0 * 255)
     for stick in sticks:
         if options.inverse:
             stick.inverse = True
 
-        stick.max_rgb_value = int(float(options.limit) / 100.0 * 255)
+        stick.max_rgb_value = max_rgb_value
 
         stick.error_reporting = False
 
+    # the color action and its arguments are the same for every stick
+    color = options.color or options.positional_color
+    if color:
+        fargs = {
+            "color": _parse_color(color),
+            "index": int(options.index),
+            "channel": int(options.channel),
+        }
+
+        # handle blink/pulse/morph
+        action = "set_color"
+        if options.blink:
+            action = "blink"
+            fargs["delay"] = int(options.delay)
+            fargs["repeats"] = int(options.repeats)
+        elif options.pulse:
+            action = "pulse"
+            fargs["duration"] = int(options.duration)
+            fargs["repeats"] = int(options.repeats)
+        elif options.morph:
+            action = "morph"
+            fargs["duration"] = int(options.duration)
+
     # Actions here work on all BlinkSticks
     for stick in sticks:
         if options.infoblock1:
@@ -324,15 +405,8 @@ def main():
             stick.info_block2 = options.infoblock2
 
         if options.mode:
-            if (
-                options.mode == "0"
-                or options.mode == "1"
-                or options.mode == "2"
-                or options.mode == "3"
-            ):
-                stick.mode = int(options.mode)
-            else:
-                print("Error: Invalid mode parameter value")
+            # argparse has already rejected anything but 0..3
+            stick.mode = int(options.mode)
 
         elif options.led_count:
             led_count = int(options.led_count)
@@ -344,52 +418,12 @@ def main():
 
         elif options.info:
             print_info(stick)
-        elif options.color or len(args) > 0:
-            if options.color:
-                color = options.color
-            else:
-                color = args[0]
-
-            # determine color
-            fargs = {}
-            if color.startswith("#"):
-                fargs["hex"] = color
-            elif color == "random":
-                fargs["name"] = "random"
-            elif color == "off":
-                fargs["hex"] = "#000000"
-            else:
-                if len(color) == 6:
-                    # If color contains 6 chars check if it's hex
-                    try:
-                        int(color, 16)
-                        fargs["hex"] = "#" + color
-                    except:
-                        fargs["name"] = color
-                else:
-                    fargs["name"] = color
-
-            fargs["index"] = int(options.index)
-            fargs["channel"] = int(options.channel)
-
-            # handle blink/pulse/morph
-            func = stick.set_color
-            if options.blink:
-                func = stick.blink
-                fargs["delay"] = options.delay
-                fargs["repeats"] = int(options.repeats)
-            elif options.pulse:
-                func = stick.pulse
-                fargs["duration"] = options.duration
-                fargs["repeats"] = int(options.repeats)
-            elif options.morph:
-                func = stick.morph
-                fargs["duration"] = options.duration
-
-            func(**fargs)
+        elif color:
+            getattr(stick, action)(**fargs)
 
         else:
-            parser.print_help()
+            # the parser above may be missing groups the command line didn't use
+            _build_parser().print_help()
             return 0
 
     return 0
@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from blinkstick.colors import RGBColor
 from blinkstick.enums import BlinkStickVariant, Mode
 from blinkstick.clients.blinkstick import BlinkStick
 from pytest_mock import MockFixture
@@ -252,6 +253,10 @@ def test_inverse_does_not_affect_max_rgb_value(make_blinkstick):
         (3, True),
         (4, False),
         (-1, False),
+        (300, False),
+        ("2", False),
+        (2.7, False),
+        ("invalid_mode", False),
         (Mode.RGB, True),
         (Mode.RGB_INVERSE, True),
         (Mode.ADDRESSABLE, True),
@@ -263,5 +268,104 @@ def test_set_mode_raises_on_invalid_mode(make_blinkstick, mode, is_valid):
     if is_valid:
         bs.mode = mode
     else:
-        with pytest.raises(ValueError):
-            bs.mode = "invalid_mode"  # noqa
+        with pytest.raises(ValueError, match="Invalid mode"):
+            bs.mode = mode  # noqa
+        bs.backend.control_transfer.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param([1, 2, 3], id="list"),
+        pytest.param(b"\x01\x02\x03", id="bytes"),
+        pytest.param(memoryview(b"\x01\x02\x03"), id="memoryview"),
+    ],
+)
+def test_set_led_data_pads_report(make_blinkstick, data):
+    """Test that set_led_data sends a zero padded report for list and bytes data."""
+    bs = make_blinkstick()
+    bs.set_led_data(1, data)
+    bs.backend.control_transfer.assert_called_once_with(
+        0x20, 0x9, 6, 0, b"\x00\x01\x01\x02\x03" + b"\x00" * 21
+    )
+
+
+@pytest.mark.parametrize(
+    "mode, expected_control_string",
+    [
+        pytest.param(Mode.RGB, b"\x04\x01", id="Mode.RGB"),
+        pytest.param(Mode.ADDRESSABLE, b"\x04\x03", id="Mode.ADDRESSABLE"),
+        pytest.param(2, b"\x04\x02", id="2"),
+        pytest.param(0, b"\x04\x00", id="0"),
+    ],
+)
+def test_set_mode_control_string(make_blinkstick, mode, expected_control_string):
+    """Test that setting the mode sends the mode feature report."""
+    bs = make_blinkstick()
+    bs.mode = mode
+    bs.backend.control_transfer.assert_called_once_with(
+        0x20, 0x9, 0x0004, 0, expected_control_string
+    )
+
+
+def test_set_led_count_control_string(make_blinkstick):
+    """Test that setting the LED count sends the LED count feature report."""
+    bs = make_blinkstick()
+    bs.led_count = 32
+    bs.backend.control_transfer.assert_called_once_with(0x20, 0x9, 0x81, 0, b"\x81\x20")
+
+
+@pytest.mark.parametrize(
+    "max_rgb_value, expected_control_string",
+    [
+        pytest.param(255, b"\x00\xff\x80\x40", id="255==Unchanged"),
+        pytest.param(10, b"\x00\x0a\x05\x02", id="10==Remapped"),
+    ],
+)
+def test_set_color_remaps_to_max_rgb_value(
+    make_blinkstick, max_rgb_value, expected_control_string
+):
+    """Test that set_color remaps the color to max_rgb_value."""
+    bs = make_blinkstick()
+    bs.max_rgb_value = max_rgb_value
+    bs.set_color(RGBColor(255, 128, 64))
+    bs.backend.control_transfer.assert_called_once_with(
+        0x20, 0x9, 0x0001, 0, expected_control_string
+    )
+
+
+def test_set_color_indexed_control_string(make_blinkstick):
+    """Test that set_color addresses a single LED with the indexed report."""
+    bs = make_blinkstick()
+    bs.set_color("#010203", channel=1, index=4)
+    bs.backend.control_transfer.assert_called_once_with(
+        0x20, 0x9, 0x0005, 0, b"\x05\x01\x04\x01\x02\x03"
+    )
+
+
+@pytest.mark.parametrize(
+    "led_count, expected_report",
+    [
+        pytest.param(0, (6, 8), id="Empty==8"),
+        pytest.param(24, (6, 8), id="24==8"),
+        pytest.param(25, (7, 16), id="25==16"),
+        pytest.param(48, (7, 16), id="48==16"),
+        pytest.param(49, (8, 32), id="49==32"),
+        pytest.param(96, (8, 32), id="96==32"),
+        pytest.param(97, (9, 64), id="97==64"),
+        pytest.param(192, (9, 64), id="192==64"),
+        pytest.param(500, (9, 64), id="500==64"),
+    ],
+)
+def test_determine_report_id(make_blinkstick, led_count, expected_report):
+    """Test that the smallest LED data report that fits the frame is chosen."""
+    bs = make_blinkstick()
+    assert bs._determine_report_id(led_count) == expected_report
+
+
+def test_variant_renders_as_enum_name():
+    """Test that variants print by name rather than as their int value."""
+    variant = BlinkStickVariant.BLINKSTICK_PRO
+    assert str(variant) == "BlinkStickVariant.BLINKSTICK_PRO"
+    assert f"{variant}" == "BlinkStickVariant.BLINKSTICK_PRO"
+    assert variant == 2
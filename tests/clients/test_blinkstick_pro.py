@@ -0,0 +1,345 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from blinkstick.clients.blinkstick_pro import BlinkStickPro, BlinkStickProMatrix
+
+
+def test_max_rgb_value_default():
+    """Test that the default max_rgb_value is 255 and remapping is the identity."""
+    pro = BlinkStickPro(r_led_count=1)
+    assert pro.max_rgb_value == 255
+    pro.set_color(0, 0, 255, 128, 64)
+    assert pro.get_color(0, 0) == (255, 128, 64)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        pytest.param(100, 100, id="100==100"),
+        pytest.param(-1, 0, id="-1==0"),
+        pytest.param(256, 255, id="256==255"),
+        pytest.param("150", 150, id="String150==150"),
+    ],
+)
+def test_max_rgb_value_bounds(value, expected):
+    """Test that max_rgb_value is coerced and clamped to 0..255."""
+    pro = BlinkStickPro()
+    pro.max_rgb_value = value
+    assert pro.max_rgb_value == expected
+
+
+def test_set_color_remaps_values():
+    """Test that set_color remaps the values to max_rgb_value."""
+    pro = BlinkStickPro(r_led_count=1, max_rgb_value=10)
+    pro.set_color(0, 0, 255, 128, 64)
+    assert pro.get_color(0, 0) == (10, 5, 2)
+
+
+def test_set_color_without_remap():
+    """Test that set_color stores the raw values when remap_values is False."""
+    pro = BlinkStickPro(r_led_count=1, max_rgb_value=10)
+    pro.set_color(0, 0, 255, 128, 64, remap_values=False)
+    assert pro.get_color(0, 0) == (255, 128, 64)
+
+
+def test_max_rgb_value_change_applies_to_new_colors():
+    """Test that changing max_rgb_value after construction is honoured."""
+    pro = BlinkStickPro(r_led_count=1)
+    pro.max_rgb_value = 10
+    pro.set_color(0, 0, 255, 255, 255)
+    assert pro.get_color(0, 0) == (10, 10, 10)
+
+
+def test_set_pixels_bulk():
+    """Test that set_pixels_bulk matches calling set_color for each pixel."""
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    bulk = BlinkStickPro(g_led_count=3, max_rgb_value=100)
+    single = BlinkStickPro(g_led_count=3, max_rgb_value=100)
+
+    bulk.set_pixels_bulk(1, colors)
+    for index, (r, g, b) in enumerate(colors):
+        single.set_color(1, index, r, g, b)
+
+    assert bulk.data == single.data
+
+
+def test_set_frame():
+    """Test that set_frame writes every channel."""
+    pro = BlinkStickPro(r_led_count=1, g_led_count=1, b_led_count=1)
+    pro.set_frame([[(1, 2, 3)], [(4, 5, 6)], [(7, 8, 9)]])
+    assert pro.get_color(0, 0) == (1, 2, 3)
+    assert pro.get_color(1, 0) == (4, 5, 6)
+    assert pro.get_color(2, 0) == (7, 8, 9)
+
+
+def test_send_data_all_sleeps_once(mocker):
+    """Test that send_data_all sends every channel and waits once per frame."""
+    sleep = mocker.patch("blinkstick.clients.blinkstick_pro.time.sleep")
+    mocker.patch("blinkstick.clients.blinkstick_pro.time.monotonic", return_value=0.0)
+    pro = BlinkStickPro(r_led_count=1, g_led_count=1, b_led_count=1)
+    pro.bstick = MagicMock()
+
+    pro.send_data_all()
+    sleep.assert_not_called()
+
+    pro.send_data_all()
+    assert pro.bstick.set_led_data.call_count == 6
+    sleep.assert_called_once_with(pro.data_transmission_delay)
+
+
+def test_send_data_sleeps_only_for_remaining_delay(mocker):
+    """Test that time spent between sends counts towards the transmission delay."""
+    sleep = mocker.patch("blinkstick.clients.blinkstick_pro.time.sleep")
+    monotonic = mocker.patch("blinkstick.clients.blinkstick_pro.time.monotonic")
+    pro = BlinkStickPro(r_led_count=1, delay=0.01)
+    pro.bstick = MagicMock()
+
+    monotonic.return_value = 1.0
+    pro.send_data(0)
+
+    monotonic.return_value = 1.004
+    pro.send_data(0)
+    assert sleep.call_args.args[0] == pytest.approx(0.006)
+
+    sleep.reset_mock()
+    monotonic.return_value = 1.1
+    pro.send_data(0)
+    sleep.assert_not_called()
+
+
+def test_send_data_all_without_device(mocker):
+    """Test that send_data_all does nothing when not connected."""
+    sleep = mocker.patch("blinkstick.clients.blinkstick_pro.time.sleep")
+    pro = BlinkStickPro(r_led_count=1)
+
+    pro.send_data_all()
+
+    sleep.assert_not_called()
+
+
+def test_get_packet_data():
+    """Test that get_packet_data returns the channel data as GRB bytes."""
+    pro = BlinkStickPro(b_led_count=2)
+    pro.set_color(2, 0, 1, 2, 3)
+    pro.set_color(2, 1, 4, 5, 6)
+    assert pro.get_packet_data(2) == bytes([2, 1, 3, 5, 4, 6])
+
+
+def test_clear():
+    """Test that clear sets every pixel on every channel to black."""
+    pro = BlinkStickPro(r_led_count=2, g_led_count=1, b_led_count=3)
+    pro.set_frame([[(1, 2, 3)] * 2, [(4, 5, 6)], [(7, 8, 9)] * 3])
+    pro.clear()
+    assert pro.data == [bytearray(6), bytearray(3), bytearray(9)]
+
+
+def test_clear_keeps_buffers():
+    """Test that clear zeroes the channel buffers in place."""
+    pro = BlinkStickPro(r_led_count=2)
+    pro.set_color(0, 1, 1, 2, 3)
+    view = pro.get_packet_memoryview(0)
+    pro.clear()
+    assert view == bytes(6)
+
+
+def test_matrix_clear():
+    """Test that clear sets every pixel in the matrix to black."""
+    matrix = BlinkStickProMatrix(r_columns=2, r_rows=2)
+    matrix.set_color(1, 1, 255, 255, 255)
+    matrix.clear()
+    assert matrix.get_color(1, 1) == (0, 0, 0)
+
+
+def test_send_data_logs_errors(caplog):
+    """Test that a failed transfer is logged rather than raised."""
+    pro = BlinkStickPro(r_led_count=1)
+    pro.bstick = MagicMock()
+    pro.bstick.set_led_data.side_effect = Exception("device removed")
+
+    pro.send_data(0)
+
+    assert "Could not send data to channel 0" in caplog.text
+
+
+def test_get_packet_memoryview():
+    """Test that get_packet_memoryview returns a read-only view of the channel data."""
+    pro = BlinkStickPro(r_led_count=1)
+    pro.set_color(0, 0, 1, 2, 3)
+    view = pro.get_packet_memoryview(0)
+    assert view.readonly
+    assert view == bytes([2, 1, 3])
+    pro.set_color(0, 0, 4, 5, 6)
+    assert view == bytes([5, 4, 6])
+
+
+def test_set_pixels_bulk_too_many_colors():
+    """Test that set_pixels_bulk rejects more colors than the channel has LEDs."""
+    pro = BlinkStickPro(r_led_count=1)
+    with pytest.raises(IndexError):
+        pro.set_pixels_bulk(0, [(1, 2, 3), (4, 5, 6)])
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        pytest.param(BlinkStickPro(r_led_count=1), id="BlinkStickPro"),
+        pytest.param(BlinkStickProMatrix(r_columns=1, r_rows=1), id="Matrix"),
+    ],
+)
+def test_no_instance_dict(instance):
+    """Test that frame buffer state is held in slots rather than an instance dict."""
+    assert not hasattr(instance, "__dict__")
+
+
+def test_matrix_send_data_slices_channel_columns():
+    """Test that each channel is sent the GRB data of its own columns."""
+    matrix = BlinkStickProMatrix(r_columns=1, r_rows=2, g_columns=2, g_rows=2)
+    matrix.bstick = MagicMock()
+    matrix.set_color(0, 1, 1, 2, 3)
+    matrix.set_color(2, 0, 4, 5, 6)
+
+    matrix.send_data(1)
+
+    channel, data = matrix.bstick.set_led_data.call_args.args
+    assert channel == 1
+    assert data == bytes([0, 0, 0, 5, 4, 6, 0, 0, 0, 0, 0, 0])
+    assert matrix.get_packet_data(0) == bytes(6)
+
+
+@pytest.mark.parametrize(
+    "x1, y1, x2, y2, expected",
+    [
+        pytest.param(0, 0, 3, 1, [(0, 0), (1, 0), (2, 1), (3, 1)], id="shallow"),
+        pytest.param(1, 3, 0, 0, [(1, 3), (1, 2), (0, 1), (0, 0)], id="steep-reversed"),
+    ],
+)
+def test_matrix_line(x1, y1, x2, y2, expected):
+    """Test that line returns the drawn points and remaps their color."""
+    matrix = BlinkStickProMatrix(r_columns=4, r_rows=4, max_rgb_value=10)
+    assert matrix.line(x1, y1, x2, y2, 255, 128, 0) == expected
+    for x, y in expected:
+        assert matrix.get_color(x, y) == (10, 5, 0)
+    assert sum(matrix.matrix_data) == 15 * len(expected)
+
+
+def test_matrix_line_without_points():
+    """Test that line still draws when the points are not collected."""
+    matrix = BlinkStickProMatrix(r_columns=3, r_rows=1)
+    assert matrix.line(0, 0, 2, 0, 1, 2, 3, return_points=False) == []
+    assert matrix.matrix_data == bytes([2, 1, 3]) * 3
+
+
+def _matrix_rows(matrix):
+    return [
+        [matrix.get_color(x, y)[0] for x in range(matrix.cols)]
+        for y in range(matrix.rows)
+    ]
+
+
+@pytest.mark.parametrize(
+    "method, remove, expected",
+    [
+        pytest.param("shift_left", False, [[2, 3, 1], [5, 6, 4]], id="left"),
+        pytest.param("shift_left", True, [[2, 3, 0], [5, 6, 0]], id="left-remove"),
+        pytest.param("shift_right", False, [[3, 1, 2], [6, 4, 5]], id="right"),
+        pytest.param("shift_right", True, [[0, 1, 2], [0, 4, 5]], id="right-remove"),
+        pytest.param("shift_up", False, [[4, 5, 6], [1, 2, 3]], id="up"),
+        pytest.param("shift_up", True, [[4, 5, 6], [0, 0, 0]], id="up-remove"),
+        pytest.param("shift_down", False, [[4, 5, 6], [1, 2, 3]], id="down"),
+        pytest.param("shift_down", True, [[0, 0, 0], [1, 2, 3]], id="down-remove"),
+    ],
+)
+def test_matrix_shift(method, remove, expected):
+    """Test that the shift methods move every pixel and wrap or drop the edge."""
+    matrix = BlinkStickProMatrix(r_columns=3, r_rows=2)
+    for y in range(2):
+        for x in range(3):
+            matrix.set_color(x, y, y * 3 + x + 1, 0, 0)
+
+    getattr(matrix, method)(remove=remove)
+
+    assert _matrix_rows(matrix) == expected
+
+
+def test_matrix_shift_empty():
+    """Test that shifting an empty matrix does nothing."""
+    matrix = BlinkStickProMatrix()
+    for method in ("shift_left", "shift_right", "shift_up", "shift_down"):
+        getattr(matrix, method)()
+    assert matrix.matrix_data == bytearray()
+
+
+def test_matrix_send_data_reuses_channel_buffer():
+    """Test that sending a matrix channel fills its buffer in place."""
+    matrix = BlinkStickProMatrix(r_columns=2, r_rows=1, g_columns=1, g_rows=2)
+    matrix.bstick = MagicMock()
+    buffer = matrix.data[0]
+
+    matrix.set_color(1, 1, 1, 2, 3)
+    matrix.send_data(0)
+
+    assert matrix.data[0] is buffer
+    assert buffer == bytes([0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 1, 3])
+
+
+@pytest.mark.parametrize(
+    "n, expected",
+    [
+        pytest.param(0, ["111", "101", "101", "101", "111"], id="0"),
+        pytest.param(1, ["010", "110", "010", "010", "111"], id="1"),
+        pytest.param(4, ["101", "101", "111", "001", "001"], id="4"),
+        pytest.param(7, ["111", "001", "010", "010", "010"], id="7"),
+        pytest.param(10, ["000", "000", "000", "000", "000"], id="10"),
+    ],
+)
+def test_matrix_number(n, expected):
+    """Test that number renders the 3x5 glyph of the digit."""
+    matrix = BlinkStickProMatrix(r_columns=4, r_rows=6)
+    matrix.number(1, 1, n, 255, 0, 0)
+    rows = [
+        "".join("1" if matrix.get_color(x, y)[0] else "0" for x in range(1, 4))
+        for y in range(1, 6)
+    ]
+    assert rows == expected
+
+
+@pytest.mark.parametrize(
+    "x1, y1, x2, y2",
+    [
+        pytest.param(1, 1, 3, 4, id="ordered"),
+        pytest.param(3, 4, 1, 1, id="reversed"),
+        pytest.param(2, 0, 2, 3, id="vertical"),
+        pytest.param(0, 2, 4, 2, id="horizontal"),
+    ],
+)
+def test_matrix_rectangle(x1, y1, x2, y2):
+    """Test that rectangle draws the same outline as four lines."""
+    rectangle = BlinkStickProMatrix(r_columns=5, r_rows=5, max_rgb_value=100)
+    lines = BlinkStickProMatrix(r_columns=5, r_rows=5, max_rgb_value=100)
+
+    rectangle.rectangle(x1, y1, x2, y2, 255, 128, 0)
+    lines.line(x1, y1, x1, y2, 255, 128, 0)
+    lines.line(x1, y1, x2, y1, 255, 128, 0)
+    lines.line(x2, y1, x2, y2, 255, 128, 0)
+    lines.line(x1, y2, x2, y2, 255, 128, 0)
+
+    assert rectangle.matrix_data == lines.matrix_data
+
+
+@pytest.mark.parametrize(
+    "x1, y1, x2, y2",
+    [
+        pytest.param(0, 0, 3, 4, id="PastLastRow"),
+        pytest.param(0, 0, 4, 3, id="PastLastColumn"),
+        pytest.param(-1, 0, 1, 1, id="NegativeX"),
+        pytest.param(0, -1, 1, 1, id="NegativeY"),
+    ],
+)
+def test_matrix_rectangle_out_of_range(x1, y1, x2, y2):
+    """Test that rectangle rejects corners outside the matrix without resizing it."""
+    matrix = BlinkStickProMatrix(r_columns=4, r_rows=4)
+    with pytest.raises(IndexError):
+        matrix.rectangle(x1, y1, x2, y2, 255, 128, 0)
+    assert len(matrix.matrix_data) == 4 * 4 * 3
+    assert not any(matrix.matrix_data)
@@ -1,9 +1,14 @@
+import dataclasses
+import sys
+
 import pytest
 
 from blinkstick.colors import (
     NamedColor,
     RGBColor,
+    remap_rgb_bytes,
 )
+from blinkstick.exceptions import RGBColorException
 
 
 def test_all_named_colors_present(w3c_colors):
@@ -31,6 +36,23 @@ def test_named_color_case_insensitive(w3c_colors):
         )
 
 
+def test_named_color_value_is_rgb_colour():
+    assert NamedColor.RED.value == RGBColor(255, 0, 0)
+    assert NamedColor(RGBColor(255, 0, 0)) is NamedColor.RED
+
+
+def test_named_color_alias():
+    assert NamedColor.from_name("cyan") is NamedColor.AQUA
+    assert NamedColor.from_name("Grey") is NamedColor.GRAY
+
+
+def test_named_color_name_for():
+    for color in NamedColor:
+        assert NamedColor.name_for(color.value) == color.name
+    assert NamedColor.name_for(RGBColor(128, 128, 128)) == "GRAY"
+    assert NamedColor.name_for(RGBColor(1, 2, 3)) is None
+
+
 @pytest.mark.parametrize(
     "input_value, expected_output",
     [
@@ -48,6 +70,77 @@ def test_rgb_colour_hex_from_hex(input_value, expected_output):
     assert RGBColor.from_hex(input_value).hex == expected_output
 
 
+@pytest.mark.parametrize(
+    "input_value, expected_output",
+    [
+        ("#123456", RGBColor(0x12, 0x34, 0x56)),
+        ("#abcdef", RGBColor(0xAB, 0xCD, 0xEF)),
+        ("#1a2", RGBColor(0x11, 0xAA, 0x22)),
+        ("#000", RGBColor(0, 0, 0)),
+    ],
+)
+def test_rgb_colour_from_hex_components(input_value, expected_output):
+    assert RGBColor.from_hex(input_value) == expected_output
+
+
+@pytest.mark.parametrize(
+    "input_value",
+    [
+        "",
+        "#",
+        "#ff",
+        "#ffff",
+        "#fffffff",
+        "#ggg",
+        "#12345g",
+        "##fff",
+        "#0x1234",
+        "#+ff",
+        "#f_f",
+        " fff",
+        "fff\n",
+    ],
+)
+def test_rgb_colour_from_hex_invalid(input_value):
+    with pytest.raises(RGBColorException):
+        RGBColor.from_hex(input_value)
+    # failures are not cached, so the same input raises again
+    with pytest.raises(RGBColorException):
+        RGBColor.from_hex(input_value)
+
+
+@pytest.mark.parametrize(
+    "components",
+    [
+        pytest.param((1.5, 0, 0), id="Float"),
+        pytest.param((0, "1", 0), id="String"),
+        pytest.param((0, 0, None), id="None"),
+    ],
+)
+def test_rgb_colour_rejects_non_integer_components(components):
+    with pytest.raises(RGBColorException):
+        RGBColor(*components)
+
+
+def test_rgb_colour_from_hex_returns_new_instances():
+    first = RGBColor.from_hex("#102030")
+    second = RGBColor.from_hex("#102030")
+    assert first == second == RGBColor(16, 32, 48)
+    assert first is not second
+
+
+def test_rgb_colour_is_frozen():
+    color = RGBColor(1, 2, 3)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        color.red = 4  # type: ignore[misc]
+    assert {color: "value"}[RGBColor(1, 2, 3)] == "value"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires dataclass slots")
+def test_rgb_colour_has_no_instance_dict():
+    assert not hasattr(RGBColor(1, 2, 3), "__dict__")
+
+
 def test_remap_rgb_to_smaller_range():
     # RGB(255, 128, 64) remapped to max 10 should be (10, 5, 3)
     color = RGBColor(255, 128, 64)
@@ -137,3 +230,88 @@ def test_remap_fractional_results():
     assert remapped.red == 0
     assert remapped.green == 0
     assert remapped.blue == 0
+
+
+def test_remap_exact_multiples():
+    # 147 * 85 / 255 is exactly 49, which float arithmetic rounded down to 48
+    color = RGBColor(147, 155, 255)
+    remapped = color.remap_to_new_range(85)
+    assert remapped == RGBColor(49, 51, 85)
+
+
+def test_invert():
+    assert ~RGBColor(0, 128, 255) == RGBColor(255, 127, 0)
+    assert ~~RGBColor(10, 20, 30) == RGBColor(10, 20, 30)
+
+
+@pytest.mark.parametrize(
+    "red, green, blue",
+    [(-1, 0, 0), (0, 256, 0), (0, 0, 1000), (-256, 0, 0), (0, 0, -255)],
+)
+def test_rgb_colour_out_of_range(red, green, blue):
+    with pytest.raises(RGBColorException):
+        RGBColor(red, green, blue)
+
+
+def test_rgb_colour_unchecked_matches_constructor():
+    color = RGBColor._unchecked(1, 2, 3)
+    assert color == RGBColor(1, 2, 3)
+    assert hash(color) == hash(RGBColor(1, 2, 3))
+    assert color.hex == "#010203"
+
+
+def test_random_colour(mocker):
+    mocker.patch("blinkstick.colors.random.getrandbits", return_value=0x123456)
+    assert RGBColor.random() == RGBColor(0x12, 0x34, 0x56)
+
+
+def test_rgb_colour_unpacking():
+    red, green, blue = RGBColor(1, 2, 3)
+    assert (red, green, blue) == (1, 2, 3)
+    assert list(RGBColor(4, 5, 6)) == [4, 5, 6]
+
+
+def test_rgb_colour_as_bytes():
+    assert RGBColor(1, 2, 3).as_bytes == b"\x01\x02\x03"
+    assert RGBColor.pack_many([RGBColor(1, 2, 3), RGBColor(4, 5, 6)]) == bytes(
+        [1, 2, 3, 4, 5, 6]
+    )
+    assert RGBColor.pack_many([]) == b""
+
+
+@pytest.mark.parametrize("max_value", [-10, 0, 10, 85, 127, 255, 1000])
+def test_remap_rgb_bytes_matches_remap_to_new_range(max_value):
+    colors = [RGBColor(255, 128, 64), RGBColor(147, 155, 0), RGBColor(1, 2, 3)]
+    expected = RGBColor.pack_many(
+        color.remap_to_new_range(max_value) for color in colors
+    )
+    packed = RGBColor.pack_many(colors)
+    assert remap_rgb_bytes(packed, max_value) == expected
+    assert remap_rgb_bytes(memoryview(bytearray(packed)), max_value) == expected
+
+
+def test_rgb_colour_from_int():
+    assert RGBColor.from_int(0x123456) == RGBColor(0x12, 0x34, 0x56)
+    assert RGBColor.from_int(0x123456).to_int() == 0x123456
+    assert RGBColor(255, 255, 255).to_int() == 0xFFFFFF
+
+
+@pytest.mark.parametrize("value", [-1, 0x1000000])
+def test_rgb_colour_from_int_invalid(value):
+    with pytest.raises(RGBColorException):
+        RGBColor.from_int(value)
+
+
+def test_rgb_colour_packet_bytes():
+    assert RGBColor(1, 2, 3).packet_bytes == b"\x02\x01\x03"
+    assert RGBColor.packet_bytes_many([RGBColor(1, 2, 3), RGBColor(4, 5, 6)]) == bytes(
+        [2, 1, 3, 5, 4, 6]
+    )
+
+
+def test_random_many(mocker):
+    mocker.patch(
+        "blinkstick.colors.random.randbytes", return_value=b"\x01\x02\x03\x04\x05\x06"
+    )
+    assert RGBColor.random_many(2) == [RGBColor(1, 2, 3), RGBColor(4, 5, 6)]
+    assert len(RGBColor.random_many(0)) == 0
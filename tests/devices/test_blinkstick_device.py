@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 from blinkstick.enums import BlinkStickVariant
 from blinkstick.models import SerialDetails
@@ -58,3 +60,17 @@ def test_blinkstick_device_variant(make_blinkstick_device):
         major_version=1,  #  major version is 1 from the serial number
         version_attribute=version_attribute,
     )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires dataclass slots")
+def test_blinkstick_device_has_no_instance_dict(make_blinkstick_device):
+    blinkstick_device = make_blinkstick_device()
+    assert not hasattr(blinkstick_device, "__dict__")
+    assert not hasattr(blinkstick_device.serial_details, "__dict__")
+
+
+def test_blinkstick_device_interns_descriptor_strings(make_blinkstick_device):
+    first = make_blinkstick_device(manufacturer="".join(["Agile", " Innovative"]))
+    second = make_blinkstick_device(manufacturer="".join(["Agile", " Innovative"]))
+    assert first.manufacturer is second.manufacturer
+    assert first.description is second.description
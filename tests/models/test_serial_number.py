@@ -0,0 +1,42 @@
+import pytest
+from blinkstick.models import SerialDetails
+
+
+def test_serial_number_initialization():
+    serial = "BS123456-1.0"
+    serial_number = SerialDetails(serial=serial)
+
+    assert serial_number.serial == serial
+    assert serial_number.sequence_number == 123456
+    assert serial_number.major_version == 1
+    assert serial_number.minor_version == 0
+
+
+def test_serial_number_invalid_serial():
+    with pytest.raises(ValueError, match="Invalid serial number: BS123456"):
+        SerialDetails(serial="BS123456")
+
+
+@pytest.mark.parametrize(
+    "serial, expected",
+    [
+        pytest.param("BS000001-3.0", (1, 3, 0), id="BlinkStick Square"),
+        pytest.param("BS123456-10.25", (123456, 10, 25), id="multi-digit version"),
+        pytest.param("BS123456-1.0-extra", (123456, 1, 0), id="trailing characters"),
+    ],
+)
+def test_serial_number_parsing(serial, expected):
+    serial_number = SerialDetails(serial=serial)
+    assert (
+        serial_number.sequence_number,
+        serial_number.major_version,
+        serial_number.minor_version,
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    "serial", ["", "BS", "XX123456-1.0", "BS-1.0", "BS123456-1.", "BS12a456-1.0"]
+)
+def test_serial_number_malformed(serial):
+    with pytest.raises(ValueError, match="Invalid serial number"):
+        SerialDetails(serial=serial)
@@ -0,0 +1,91 @@
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+from blinkstick.clients.blinkstick import BlinkStick
+from scripts.main import main
+
+
+@pytest.fixture
+def run_main(mocker):
+    """Run the CLI with the given arguments against a single mocked stick."""
+    mocker.patch("importlib.metadata.version", return_value="1.0.0")
+
+    def _run_main(*args, stick=None):
+        if stick is None:
+            stick = MagicMock()
+        mocker.patch("blinkstick.find_all", return_value=[stick])
+        mocker.patch("sys.argv", ["blinkstick", *args])
+        return main(), stick
+
+    return _run_main
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        pytest.param((), id="NoArguments"),
+        pytest.param(("-v",), id="Verbose"),
+        pytest.param(("-s", "BS000001-3.0"), id="Serial"),
+    ],
+)
+def test_no_action_prints_full_help(run_main, mocker, capsys, args):
+    """Test that help printed when there is nothing to do lists every option group."""
+    mocker.patch("blinkstick.find_by_serial", return_value=MagicMock())
+    result, _ = run_main(*args)
+    output = capsys.readouterr().out
+    assert result == 0
+    for title in (
+        "Change color",
+        "Control animations",
+        "Device data and behaviour",
+        "Advanced options",
+    ):
+        assert title in output
+
+
+@pytest.mark.parametrize(
+    "args, expected_control_string",
+    [
+        pytest.param(("red",), b"\x00\xff\x00\x00", id="Name"),
+        pytest.param(("--set-color", "#102030"), b"\x00\x10\x20\x30", id="Hex"),
+        pytest.param(("102030",), b"\x00\x10\x20\x30", id="BareHex"),
+        pytest.param(("off",), b"\x00\x00\x00\x00", id="Off"),
+    ],
+)
+def test_set_color_sends_color(
+    make_blinkstick, run_main, args, expected_control_string
+):
+    """Test that a color argument is sent to the stick."""
+    result, stick = run_main(*args, stick=make_blinkstick())
+    assert result == 0
+    stick.backend.control_transfer.assert_called_once_with(
+        0x20, 0x9, 0x0001, 0, expected_control_string
+    )
+
+
+@pytest.mark.parametrize(
+    "args, action, expected_kwargs",
+    [
+        pytest.param(
+            ("red", "--blink", "--delay", "100", "--repeats", "2"),
+            "blink",
+            {"delay": 100, "repeats": 2},
+            id="Blink",
+        ),
+        pytest.param(
+            ("red", "--pulse", "--duration", "200"),
+            "pulse",
+            {"duration": 200, "repeats": 1},
+            id="Pulse",
+        ),
+        pytest.param(("red", "--morph"), "morph", {"duration": 1000}, id="Morph"),
+    ],
+)
+def test_animation_calls_stick(run_main, args, action, expected_kwargs):
+    """Test that animation options call the matching stick method."""
+    result, stick = run_main(*args, stick=create_autospec(BlinkStick, instance=True))
+    assert result == 0
+    getattr(stick, action).assert_called_once_with(
+        color="red", index=0, channel=0, **expected_kwargs
+    )
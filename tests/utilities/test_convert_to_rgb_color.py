@@ -0,0 +1,22 @@
+from blinkstick.colors import RGBColor, NamedColor
+from blinkstick.utilities import convert_to_rgb_color
+
+
+def test_convert_to_rgb_color_resolves_color_name():
+    assert convert_to_rgb_color("red") == NamedColor.RED.value
+
+
+def test_convert_to_rgb_color_resolves_hex_string():
+    assert convert_to_rgb_color("#102030") == RGBColor(16, 32, 48)
+
+
+def test_convert_to_rgb_color_passes_rgb_color_through():
+    color = RGBColor(1, 2, 3)
+    assert convert_to_rgb_color(color) is color
+
+
+def test_convert_to_rgb_color_random_is_not_cached(mocker):
+    random = mocker.patch.object(RGBColor, "random", side_effect=RGBColor.random)
+    convert_to_rgb_color("random")
+    convert_to_rgb_color("Random")
+    assert random.call_count == 2